@@ -1,7 +1,13 @@
+import copy
+import ipaddress
+import math
+import operator
 import re
-from typing import Dict, List, Any, Optional, Union, TypeVar, Generic, Callable, Type, Tuple
+import socket
+import sys
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Union, TypeVar, Generic, Callable, Type, Tuple, FrozenSet, Iterable
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
@@ -9,35 +15,115 @@ from enum import Enum
 T = TypeVar('T')
 U = TypeVar('U')
 
+# Separators stripped from phone numbers: '-', '(', ')', '.' and every character the
+# regex class \s matches (ASCII and Unicode whitespace)
+_PHONE_STRIP_TABLE = str.maketrans('', '', (
+    '-().\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+))
+
+# Built-in pattern for the Schema.email() factory - unanchored, applied with fullmatch()
+_EMAIL_RE = re.compile(r'[^\s@]+@[^\s@]+\.[^\s@]+')
+
+# Dotted-quad IPv4 - octets allow leading zeros ("001"), which socket.inet_pton rejects.
+# Applied with fullmatch(), so a trailing newline fails.
+_IPV4_RE = re.compile(r'(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)')
+
+# Recognizes fixed-length digit patterns such as r'^\d{5}$', which are checked without regex
+_FIXED_DIGITS_PATTERN = re.compile(r'\^\\d\{(\d+)\}\$')
+
+# Characters allowed in the hex groups of a canonical (lowercase) UUID
+_UUID_HEX_DIGITS = frozenset('0123456789abcdef')
+
+# Arrays shorter than this are validated item by item (NumPy setup costs more than it saves)
+_VECTORIZE_MIN_ITEMS = 32
+# Largest magnitude up to which every int is exactly representable as a float64
+_FLOAT_EXACT_INT_MAX = 2 ** 53
+
+@lru_cache(maxsize=1)
+def _numpy() -> Any:
+    """Import NumPy on first use - it is optional and only speeds up large numeric arrays,
+    so `import schema` does not pay for loading it. Returns None when it is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+@lru_cache(maxsize=512)
+def _compile_pattern(regex: str) -> 're.Pattern[str]':
+    """Compile a regex once per process - Pattern objects are immutable and safe to share"""
+    return re.compile(regex)
+
+def _generate_function(name: str, params: Tuple[str, ...], body: List[str],
+                       constants: Dict[str, Any]) -> Callable:
+    """Build a function from body source lines, with constants bound as closure variables"""
+    indent = "\n        "
+    source = (f"def _make({', '.join(constants)}):\n"
+              f"    def {name}({', '.join(params)}):{indent}{indent.join(body) or 'pass'}\n"
+              f"    return {name}\n")
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace["_make"](**constants)
+
 class ValidationLevel(Enum):
     """Validation severity levels for different types of validation messages"""
     ERROR = "error"      # Validation fails
     WARNING = "warning"  # Validation continues but warns
     INFO = "info"        # Informational messages
 
-@dataclass
 class ValidationError:
     """Individual validation error with context and metadata"""
-    field: str                    # Field path where error occurred
-    message: str                  # Human-readable error message
-    value: Any                    # The value that failed validation
-    level: ValidationLevel = ValidationLevel.ERROR  # Error severity level
-    code: Optional[str] = None    # Machine-readable error code
+    # Plain slotted class rather than a dataclass - one is allocated for every failure
+    __slots__ = ('field', 'message', 'value', 'level', 'code')
+    
+    def __init__(self, field: str, message: str, value: Any,
+                 level: ValidationLevel = ValidationLevel.ERROR, code: Optional[str] = None):
+        """Initialize the error with its field path, message and metadata"""
+        self.field = field            # Field path where error occurred
+        self.message = message        # Human-readable error message
+        self.value = value            # The value that failed validation
+        self.level = level            # Error severity level
+        self.code = code              # Machine-readable error code
+    
+    def __repr__(self) -> str:
+        """Show all fields, matching the former dataclass representation"""
+        return (f"ValidationError(field={self.field!r}, message={self.message!r}, value={self.value!r}, "
+                f"level={self.level!r}, code={self.code!r})")
+    
+    def __eq__(self, other: Any) -> bool:
+        """Compare errors field by field, matching the former dataclass equality"""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.field, self.message, self.value, self.level, self.code) ==
+                (other.field, other.message, other.value, other.level, other.code))
 
-@dataclass
 class ValidationResult:
     """Result of a validation operation with enhanced error handling"""
-    is_valid: bool                # Whether validation passed
-    errors: List[ValidationError] = None      # List of validation errors
-    warnings: List[ValidationError] = None    # List of validation warnings
-    data: Optional[Dict[str, Any]] = None     # Optional validated data
-    
-    def __post_init__(self):
-        """Initialize empty lists if None to avoid mutable default arguments"""
-        if self.errors is None:
-            self.errors = []
-        if self.warnings is None:
-            self.warnings = []
+    # Plain slotted class rather than a dataclass - one is allocated for every validate() call
+    __slots__ = ('is_valid', 'errors', 'warnings', 'data')
+    
+    def __init__(self, is_valid: bool, errors: Optional[List[ValidationError]] = None,
+                 warnings: Optional[List[ValidationError]] = None, data: Optional[Dict[str, Any]] = None):
+        """Initialize the result, creating fresh error and warning lists when none are given"""
+        self.is_valid = is_valid                                      # Whether validation passed
+        self.errors = [] if errors is None else errors                # List of validation errors
+        self.warnings = [] if warnings is None else warnings          # List of validation warnings
+        self.data = data                                              # Optional validated data
+    
+    def __repr__(self) -> str:
+        """Show all fields, matching the former dataclass representation"""
+        return (f"ValidationResult(is_valid={self.is_valid!r}, errors={self.errors!r}, "
+                f"warnings={self.warnings!r}, data={self.data!r})")
+    
+    def __eq__(self, other: Any) -> bool:
+        """Compare results field by field, matching the former dataclass equality"""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.is_valid, self.errors, self.warnings, self.data) ==
+                (other.is_valid, other.errors, other.warnings, other.data))
     
     def add_error(self, field: str, message: str, value: Any, code: Optional[str] = None):
         """Add an error to the validation result and mark as invalid"""
@@ -50,6 +136,10 @@ class ValidationResult:
 
 class Validator(ABC, Generic[T]):
     """Base validator class with enhanced type safety and developer support"""
+    # Slotted so attribute reads in validate() skip the instance dict
+    __slots__ = ('_custom_message', '_field_name', '_required', '_transform', '_shared')
+    # Slots holding generated code, which cannot be pickled - saved as None and rebuilt on first use
+    _GENERATED_SLOTS: FrozenSet[str] = frozenset()
     
     def __init__(self):
         """Initialize base validator with common attributes"""
@@ -57,21 +147,38 @@ class Validator(ABC, Generic[T]):
         self._field_name: Optional[str] = None        # Current field name
         self._required: bool = True                   # Whether field is required
         self._transform: Optional[Callable[[Any], T]] = None  # Data transformation function
+        self._shared: bool = False                    # Shared factory instance (copy on configure)
     
     @abstractmethod
     def validate(self, value: Any, field_name: str = "") -> ValidationResult:
         """Validate a value and return a ValidationResult - must be implemented by subclasses"""
         pass
     
+    def validate_many(self, values: Iterable[Any], field_name: str = "") -> List[ValidationResult]:
+        """Validate each value independently and return one ValidationResult per value"""
+        validate = self.validate
+        return [validate(value, field_name) for value in values]
+    
+    def compile(self) -> 'Validator[T]':
+        """Prepare this validator (and any nested validators) for repeated validation
+        
+        Generates code that would otherwise be built on the first validate() call, so a
+        schema defined once can be used at full speed straight away. Call validate() on
+        the returned validator.
+        """
+        return self
+    
     def with_message(self, message: str) -> 'Validator[T]':
         """Set a custom error message for this validator"""
-        self._custom_message = message
-        return self  # Return self for method chaining
+        validator = self._configurable()
+        validator._custom_message = message
+        return validator  # Return the validator for method chaining
     
     def required(self, required: bool = True) -> 'Validator[T]':
         """Set whether this field is required (default: True)"""
-        self._required = required
-        return self
+        validator = self._configurable()
+        validator._required = required
+        return validator
     
     def optional(self) -> 'Validator[T]':
         """Make this field optional (alias for required(False))"""
@@ -79,25 +186,56 @@ class Validator(ABC, Generic[T]):
     
     def transform(self, transform_func: Callable[[Any], T]) -> 'Validator[T]':
         """Add a transformation function to the validator"""
-        self._transform = transform_func
-        return self
+        validator = self._configurable()
+        validator._transform = transform_func
+        return validator
+    
+    def __getstate__(self) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """Return the state used by pickle and copy, leaving out generated code"""
+        slots = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if hasattr(self, name):
+                    slots[name] = None if name in self._GENERATED_SLOTS else getattr(self, name)
+        return getattr(self, '__dict__', None), slots
+    
+    def _configurable(self) -> 'Validator[T]':
+        """Return the instance a configuration method should modify
+        
+        Shared instances returned by the cached Schema factories are never modified;
+        configuring one returns a private copy instead.
+        """
+        if not self._shared:
+            return self
+        validator = copy.copy(self)
+        validator._shared = False
+        return validator
     
     def _handle_optional(self, value: Any, field_name: str) -> Optional[ValidationResult]:
         """Handle optional field validation - returns None if validation should continue"""
-        # Check if value is None or empty string
-        if value is None or value == "":
+        # Check if value is None or empty string (identity/type checks skip __eq__ dispatch)
+        if value is None or (isinstance(value, str) and not value):
             if not self._required:
                 # Field is optional and value is None/empty - validation passes
                 return ValidationResult(True)
             else:
                 # Field is required but value is None/empty - validation fails
                 result = ValidationResult(False)
-                result.add_error(field_name, self._custom_message or f"Field '{field_name}' is required", value, "REQUIRED")
+                result.add_error(field_name, self._required_message(field_name), value, "REQUIRED")
                 return result
         return None  # Continue with normal validation
+    
+    def _required_message(self, field_name: str) -> str:
+        """Build the error message for a required field that has no value"""
+        return self._custom_message or f"Field '{field_name}' is required"
 
 class StringValidator(Validator[str]):
     """Enhanced string validator with comprehensive validation rules"""
+    __slots__ = ('_min_length', '_max_length', '_pattern', '_pattern_match', '_pattern_message',
+                 '_fixed_digit_len', '_prefixes', '_prefix_message', '_allowed_values',
+                 '_allowed_values_str', '_allowed_set', '_allowed_lower_set', '_min_length_message',
+                 '_max_length_message', '_trim', '_case_sensitive', '_checks')
+    _GENERATED_SLOTS = frozenset({'_checks'})
     
     def __init__(self):
         """Initialize string validator with all validation options"""
@@ -105,39 +243,96 @@ class StringValidator(Validator[str]):
         self._min_length: Optional[int] = None        # Minimum string length
         self._max_length: Optional[int] = None        # Maximum string length
         self._pattern: Optional[str] = None           # Regex pattern to match
+        self._pattern_match: Optional[Callable[[str], Any]] = None  # Bound match()/fullmatch() of the pattern
+        self._pattern_message: Optional[str] = None   # Pre-formatted PATTERN_MISMATCH message
+        self._fixed_digit_len: Optional[int] = None   # Digit count when the pattern is ^\d{N}$
+        self._prefixes: Optional[Tuple[Tuple[str, int, int], ...]] = None  # (prefix, tail start, minimum total length)
+        self._prefix_message: Optional[str] = None    # Pre-formatted prefix error message
         self._allowed_values: Optional[List[str]] = None  # List of allowed values
+        self._allowed_values_str: Optional[str] = None    # Allowed values joined for error messages
+        self._allowed_set: Optional[FrozenSet[str]] = None          # Allowed values for O(1) lookups
+        self._allowed_lower_set: Optional[FrozenSet[str]] = None    # Lowercased, for case-insensitive lookups
+        self._min_length_message: Optional[str] = None    # Pre-formatted MIN_LENGTH message
+        self._max_length_message: Optional[str] = None    # Pre-formatted MAX_LENGTH message
         self._trim: bool = False                      # Whether to trim whitespace
         self._case_sensitive: bool = True             # Case sensitivity for allowed values
+        self._checks: Optional[Callable[[str, str, ValidationResult], None]] = None  # Generated on first validate()
     
     def min_length(self, length: int) -> 'StringValidator':
         """Set minimum length requirement for the string"""
-        self._min_length = length
-        return self
+        validator = self._configurable()
+        validator._min_length = length
+        validator._min_length_message = f"String must be at least {length} characters long"
+        return validator
     
     def max_length(self, length: int) -> 'StringValidator':
         """Set maximum length requirement for the string"""
-        self._max_length = length
-        return self
-    
-    def pattern(self, regex: str) -> 'StringValidator':
-        """Set regex pattern requirement for the string"""
-        self._pattern = regex
-        return self
+        validator = self._configurable()
+        validator._max_length = length
+        validator._max_length_message = f"String must be at most {length} characters long"
+        return validator
+    
+    def pattern(self, regex: Union[str, 're.Pattern[str]']) -> 'StringValidator':
+        """Set regex pattern requirement for the string (regex string or pre-compiled pattern)"""
+        validator = self._configurable()
+        validator._fixed_digit_len = None
+        if isinstance(regex, str):
+            validator._pattern = regex
+            fixed_digits = _FIXED_DIGITS_PATTERN.fullmatch(regex)
+            if fixed_digits:
+                # ^\d{N}$ is checked with len() and str.isdecimal() - no regex needed
+                validator._fixed_digit_len = int(fixed_digits.group(1))
+                validator._pattern_match = None
+            else:
+                validator._pattern_match = _compile_pattern(regex).match
+        else:
+            validator._pattern = regex.pattern
+            validator._pattern_match = regex.match
+        validator._pattern_message = f"String must match pattern: {validator._pattern}"
+        return validator
+    
+    def fullmatch_pattern(self, regex: Union[str, 're.Pattern[str]']) -> 'StringValidator':
+        """Set a regex the whole string must match - no ^/$ anchors needed in the pattern"""
+        validator = self._configurable()
+        compiled = _compile_pattern(regex) if isinstance(regex, str) else regex
+        validator._pattern = compiled.pattern
+        validator._pattern_match = compiled.fullmatch
+        validator._fixed_digit_len = None
+        validator._pattern_message = f"String must match pattern: {validator._pattern}"
+        return validator
+    
+    def prefix_any(self, prefixes: Tuple[str, ...], min_tail_len: int = 1) -> 'StringValidator':
+        """Require the string to start with one of the prefixes, followed by at least min_tail_len characters
+        
+        A cheaper alternative to pattern() for prefix checks such as r'^https?://.+' - like the
+        regex '.', the required tail characters may not be newlines.
+        """
+        validator = self._configurable()
+        validator._prefixes = tuple((prefix, len(prefix), len(prefix) + min_tail_len) for prefix in prefixes)
+        validator._prefix_message = f"String must start with one of: {', '.join(prefixes)}"
+        return validator
     
     def allowed_values(self, values: List[str]) -> 'StringValidator':
         """Set list of allowed values for the string"""
-        self._allowed_values = values
-        return self
+        validator = self._configurable()
+        validator._allowed_values = values
+        validator._allowed_values_str = ', '.join(map(str, values))
+        # Interned so that membership tests on repeated enum-like values hit on identity
+        validator._allowed_set = frozenset(sys.intern(v) if type(v) is str else v for v in values)
+        validator._allowed_lower_set = frozenset(sys.intern(v.lower()) for v in values if isinstance(v, str))
+        return validator
     
     def trim(self, trim: bool = True) -> 'StringValidator':
         """Enable/disable string trimming (removes leading/trailing whitespace)"""
-        self._trim = trim
-        return self
+        validator = self._configurable()
+        validator._trim = trim
+        return validator
     
     def case_sensitive(self, case_sensitive: bool = True) -> 'StringValidator':
         """Set case sensitivity for allowed values validation"""
-        self._case_sensitive = case_sensitive
-        return self
+        validator = self._configurable()
+        validator._case_sensitive = case_sensitive
+        return validator
     
     def validate(self, value: Any, field_name: str = "") -> ValidationResult:
         """Validate a string value against all configured rules"""
@@ -149,46 +344,106 @@ class StringValidator(Validator[str]):
         result = ValidationResult(True)
         
         # Type checking - ensure value is a string
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
             result.add_error(field_name, self._custom_message or "Value must be a string", value, "TYPE_ERROR")
             return result
         
+        # Run the checks generated for the current configuration
+        checks = self._checks or self._compile_checks()
+        checks(value, field_name, result)
+        return result
+    
+    def _has_constraints(self) -> bool:
+        """Whether any rule beyond the required/type checks is configured (trimming alone changes nothing)"""
+        return not (self._transform is None and self._min_length is None and self._max_length is None
+                    and self._fixed_digit_len is None and self._pattern_match is None
+                    and self._prefixes is None and self._allowed_set is None)
+    
+    def compile(self) -> 'StringValidator':
+        """Generate the checks for the current configuration ahead of the first validate()"""
+        if self._checks is None:
+            self._compile_checks()
+        return self
+    
+    def _configurable(self) -> 'StringValidator':
+        """Return the instance to modify, dropping its generated checks"""
+        validator = super()._configurable()
+        validator._checks = None
+        return validator
+    
+    def _compile_checks(self) -> Callable[[str, str, ValidationResult], None]:
+        """Generate a check function containing only the rules this validator has configured
+        
+        Called on the first validate() after construction or reconfiguration. Configured
+        values are bound as closure constants, so validation does not re-test every option.
+        """
+        constants: Dict[str, Any] = {}
+        lines = []
+        
         # Apply data transformation if configured
         if self._transform:
-            try:
-                value = self._transform(value)
-            except Exception as e:
-                result.add_error(field_name, f"Transformation failed: {str(e)}", value, "TRANSFORM_ERROR")
-                return result
+            constants['transform'] = self._transform
+            lines += [
+                "try:",
+                "    value = transform(value)",
+                "except Exception as e:",
+                "    result.add_error(field_name, f'Transformation failed: {str(e)}', value, 'TRANSFORM_ERROR')",
+                "    return",
+            ]
         
-        # Trim whitespace if enabled
+        # Trim whitespace if enabled - every check below sees the trimmed string, and its
+        # length is taken once for all of them
         if self._trim:
-            value = value.strip()
+            lines.append("value = value.strip()")
+        lines.append("length = len(value)")
         
-        # Length validation - check minimum length
-        if self._min_length is not None and len(value) < self._min_length:
-            result.add_error(field_name, f"String must be at least {self._min_length} characters long", value, "MIN_LENGTH")
+        # Length validation - check minimum and maximum length
+        if self._min_length is not None:
+            constants.update(min_length=self._min_length, min_length_message=self._min_length_message)
+            lines += ["if length < min_length:",
+                      "    result.add_error(field_name, min_length_message, value, 'MIN_LENGTH')"]
+        if self._max_length is not None:
+            constants.update(max_length=self._max_length, max_length_message=self._max_length_message)
+            lines += ["if length > max_length:",
+                      "    result.add_error(field_name, max_length_message, value, 'MAX_LENGTH')"]
         
-        # Length validation - check maximum length
-        if self._max_length is not None and len(value) > self._max_length:
-            result.add_error(field_name, f"String must be at most {self._max_length} characters long", value, "MAX_LENGTH")
+        # Pattern validation - check fixed digit count or regex match
+        if self._fixed_digit_len is not None:
+            constants.update(fixed_digit_len=self._fixed_digit_len, pattern_message=self._pattern_message)
+            lines += ["if length != fixed_digit_len or not value.isdecimal():",
+                      "    result.add_error(field_name, pattern_message, value, 'PATTERN_MISMATCH')"]
+        elif self._pattern_match is not None:
+            constants.update(pattern_match=self._pattern_match, pattern_message=self._pattern_message)
+            lines += ["if not pattern_match(value):",
+                      "    result.add_error(field_name, pattern_message, value, 'PATTERN_MISMATCH')"]
         
-        # Pattern validation - check regex match
-        if self._pattern is not None and not re.match(self._pattern, value):
-            result.add_error(field_name, f"String must match pattern: {self._pattern}", value, "PATTERN_MISMATCH")
+        # Prefix validation - plain startswith checks, no regex engine involved
+        if self._prefixes is not None:
+            constants.update(prefixes=self._prefixes, prefix_message=self._prefix_message)
+            lines += ["for prefix, tail_start, min_total_length in prefixes:",
+                      "    if (length >= min_total_length and value.startswith(prefix)",
+                      "            and '\\n' not in value[tail_start:min_total_length]):",
+                      "        break",
+                      "else:",
+                      "    result.add_error(field_name, prefix_message, value, 'PATTERN_MISMATCH')"]
         
-        # Allowed values validation - check if value is in allowed list
-        if self._allowed_values is not None:
-            # Handle case sensitivity for comparison
-            check_value = value if self._case_sensitive else value.lower()
-            check_values = self._allowed_values if self._case_sensitive else [v.lower() for v in self._allowed_values]
-            if check_value not in check_values:
-                result.add_error(field_name, f"Value must be one of: {', '.join(self._allowed_values)}", value, "INVALID_VALUE")
+        # Allowed values validation - case-insensitive mode compares lowercased values
+        if self._allowed_set is not None:
+            constants['allowed_message'] = f"Value must be one of: {self._allowed_values_str}"
+            if self._case_sensitive:
+                constants['allowed'] = self._allowed_set
+                lines.append("if value not in allowed:")
+            else:
+                constants['allowed'] = self._allowed_lower_set
+                lines.append("if value.lower() not in allowed:")
+            lines.append("    result.add_error(field_name, allowed_message, value, 'INVALID_VALUE')")
         
-        return result
+        self._checks = _generate_function("_string_checks", ("value", "field_name", "result"), lines, constants)
+        return self._checks
 
 class NumberValidator(Validator[Union[int, float]]):
     """Enhanced number validator with comprehensive validation rules"""
+    __slots__ = ('_min_value', '_max_value', '_integer_only', '_allowed_values', '_allowed_values_str')
     
     def __init__(self):
         """Initialize number validator with all validation options"""
@@ -197,6 +452,7 @@ class NumberValidator(Validator[Union[int, float]]):
         self._max_value: Optional[Union[int, float]] = None  # Maximum numeric value
         self._integer_only: bool = False                     # Whether only integers are allowed
         self._allowed_values: Optional[List[Union[int, float]]] = None  # List of allowed values
+        self._allowed_values_str: Optional[str] = None       # Allowed values joined for error messages
     
     def min_value(self, value: Union[int, float]) -> 'NumberValidator':
         """Set minimum value requirement for the number"""
@@ -216,6 +472,7 @@ class NumberValidator(Validator[Union[int, float]]):
     def allowed_values(self, values: List[Union[int, float]]) -> 'NumberValidator':
         """Set list of allowed values for the number"""
         self._allowed_values = values
+        self._allowed_values_str = ', '.join(map(str, values))
         return self
     
     def validate(self, value: Any, field_name: str = "") -> ValidationResult:
@@ -227,8 +484,12 @@ class NumberValidator(Validator[Union[int, float]]):
         
         result = ValidationResult(True)
         
-        # Type checking - ensure value is a number (int or float) but not boolean
-        if not isinstance(value, (int, float)) or isinstance(value, bool):
+        # Type checking - ensure value is a number (int or float) but not boolean.
+        # Exact type identity covers the common case (and rejects bool, whose type
+        # is not int); isinstance is only consulted for int/float subclasses.
+        value_type = type(value)
+        if (value_type is not int and value_type is not float
+                and (value_type is bool or not isinstance(value, (int, float)))):
             result.add_error(field_name, self._custom_message or "Value must be a number", value, "TYPE_ERROR")
             return result
         
@@ -254,12 +515,32 @@ class NumberValidator(Validator[Union[int, float]]):
         
         # Allowed values validation - check if value is in allowed list
         if self._allowed_values is not None and value not in self._allowed_values:
-            result.add_error(field_name, f"Value must be one of: {', '.join(map(str, self._allowed_values))}", value, "INVALID_VALUE")
+            result.add_error(field_name, f"Value must be one of: {self._allowed_values_str}", value, "INVALID_VALUE")
         
         return result
+    
+    def validate_many(self, values: Iterable[Any], field_name: str = "") -> List[ValidationResult]:
+        """Validate each value independently and return one ValidationResult per value
+        
+        Plain ints and floats within range are accepted in a single comprehension; anything
+        else (other types, out-of-range values, NaN) goes through validate() for its errors.
+        """
+        if self._transform is not None or self._allowed_values is not None:
+            return super().validate_many(values, field_name)
+        lower = -math.inf if self._min_value is None else self._min_value
+        upper = math.inf if self._max_value is None else self._max_value
+        allow_float = not self._integer_only
+        validate = self.validate
+        return [
+            ValidationResult(True)
+            if (type(value) is int or (allow_float and type(value) is float)) and lower <= value <= upper
+            else validate(value, field_name)
+            for value in values
+        ]
 
 class BooleanValidator(Validator[bool]):
     """Enhanced boolean validator with transformation support"""
+    __slots__ = ('_truthy_values', '_falsy_values')
     
     def __init__(self):
         """Initialize boolean validator with truthy/falsy value lists"""
@@ -302,19 +583,38 @@ class BooleanValidator(Validator[bool]):
             result.add_error(field_name, self._custom_message or "Value must be a boolean or convertible to boolean", value, "TYPE_ERROR")
             return result
 
+# Formats DateValidator tries, in order, when no explicit format is set
+_DEFAULT_DATE_FORMATS = ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%d/%m/%Y', '%m/%d/%Y')
+
+@lru_cache(maxsize=1024)
+def _parse_date(value: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    """Parse a date string with the first matching format, or return None if none match
+    
+    strptime() is slow and datetimes are immutable, so results are cached per string.
+    """
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
 class DateValidator(Validator[datetime]):
     """Enhanced date validator with format support"""
+    __slots__ = ('_format', '_formats', '_min_date', '_max_date')
     
     def __init__(self):
         """Initialize date validator with format and range options"""
         super().__init__()
         self._format: Optional[str] = None            # Expected date format string
+        self._formats: Tuple[str, ...] = _DEFAULT_DATE_FORMATS  # Formats tried when parsing strings
         self._min_date: Optional[datetime] = None     # Minimum allowed date
         self._max_date: Optional[datetime] = None     # Maximum allowed date
     
     def format(self, date_format: str) -> 'DateValidator':
         """Set expected date format for string parsing"""
         self._format = date_format
+        self._formats = (date_format,) if date_format else _DEFAULT_DATE_FORMATS
         return self
     
     def min_date(self, date: datetime) -> 'DateValidator':
@@ -340,25 +640,9 @@ class DateValidator(Validator[datetime]):
         if isinstance(value, datetime):
             parsed_date = value
         elif isinstance(value, str):
-            # Try to parse string as date
-            try:
-                if self._format:
-                    # Use specified format
-                    parsed_date = datetime.strptime(value, self._format)
-                else:
-                    # Try common date formats automatically
-                    for fmt in ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%d/%m/%Y', '%m/%d/%Y']:
-                        try:
-                            parsed_date = datetime.strptime(value, fmt)
-                            break
-                        except ValueError:
-                            continue
-                    else:
-                        # No format matched
-                        result.add_error(field_name, "Invalid date format", value, "DATE_FORMAT_ERROR")
-                        return result
-            except ValueError:
-                # Date parsing failed
+            # Parse with the specified format, or try the common formats in order
+            parsed_date = _parse_date(value, self._formats)
+            if parsed_date is None:
                 result.add_error(field_name, "Invalid date format", value, "DATE_FORMAT_ERROR")
                 return result
         else:
@@ -378,13 +662,21 @@ class DateValidator(Validator[datetime]):
 
 class ObjectValidator(Validator[Dict[str, Any]]):
     """Enhanced object validator with strict mode and unknown field handling"""
+    __slots__ = ('_schema', '_validate_fields', '_strict', '_allow_unknown', '_fail_fast')
+    _GENERATED_SLOTS = frozenset({'_validate_fields'})
     
     def __init__(self, schema: Dict[str, Validator]):
         """Initialize object validator with field schema"""
         super().__init__()
+        # Check field validators once here so validate() can rely on the Validator interface
+        for schema_field_name, validator in schema.items():
+            if not isinstance(validator, Validator):
+                raise TypeError(f"Schema field '{schema_field_name}' must be a Validator, got {type(validator).__name__}")
         self._schema = schema                         # Schema defining field validators
         self._strict: bool = False                    # Whether to allow unknown fields
         self._allow_unknown: bool = True              # Whether unknown fields are allowed
+        self._fail_fast: bool = False                 # Whether to stop at the first failing field
+        self._compile_fields()                        # Generated per-field checks
     
     def strict(self, strict: bool = True) -> 'ObjectValidator':
         """Set strict mode (no unknown fields allowed)"""
@@ -396,6 +688,28 @@ class ObjectValidator(Validator[Dict[str, Any]]):
         self._allow_unknown = allow
         return self
     
+    def fail_fast(self, fail_fast: bool = True) -> 'ObjectValidator':
+        """Set whether validation stops at the first failing field
+        
+        Fields are then checked cheapest first (type checks, then string and format
+        checks, then nested and custom validators), so an invalid object is rejected with
+        as little work as possible. Only the errors of the first failing field are reported.
+        """
+        self._fail_fast = fail_fast
+        self._compile_fields()
+        return self
+    
+    def _compile_fields(self) -> Callable[[Dict[str, Any], str, ValidationResult], None]:
+        """Generate the per-field checks for the schema and the fail-fast setting"""
+        self._validate_fields = _compile_field_checks(self._schema, self._fail_fast)
+        return self._validate_fields
+    
+    def compile(self) -> 'ObjectValidator':
+        """Prepare every field validator for repeated validation"""
+        for validator in self._schema.values():
+            validator.compile()
+        return self
+    
     def validate(self, value: Any, field_name: str = "") -> ValidationResult:
         """Validate an object against the defined schema"""
         # Handle optional fields first
@@ -406,38 +720,127 @@ class ObjectValidator(Validator[Dict[str, Any]]):
         result = ValidationResult(True)
         
         # Type checking - ensure value is a dictionary but not a list
-        if not isinstance(value, dict):
+        if type(value) is not dict and not isinstance(value, dict):
             result.add_error(field_name, self._custom_message or "Value must be an object", value, "TYPE_ERROR")
             return result
         
         # Check for unknown fields in strict mode
         if self._strict:
-            unknown_fields = set(value.keys()) - set(self._schema.keys())
+            unknown_fields = value.keys() - self._schema.keys()
             if unknown_fields:
                 result.add_error(field_name, f"Unknown fields not allowed: {', '.join(unknown_fields)}", value, "UNKNOWN_FIELDS")
+                if self._fail_fast:
+                    return result
         
-        # Validate each field in the schema
-        for schema_field_name, validator in self._schema.items():
-            # Build field path for nested validation
-            current_field_name = f"{field_name}.{schema_field_name}" if field_name else schema_field_name
-            
-            if schema_field_name in value:
-                # Field exists - validate it
-                field_result = validator.validate(value[schema_field_name], current_field_name)
-                if not field_result.is_valid:
-                    # Add all errors from field validation
-                    result.errors.extend(field_result.errors)
-                    result.is_valid = False
-                # Add all warnings from field validation
-                result.warnings.extend(field_result.warnings)
-            elif hasattr(validator, '_required') and validator._required:
-                # Field is required but missing
-                result.add_error(current_field_name, f"Missing required field: {schema_field_name}", None, "MISSING_FIELD")
+        # Validate each field in the schema (unrolled per field, see _compile_field_checks)
+        (self._validate_fields or self._compile_fields())(value, field_name, result)
         
         return result
 
+def _field_check_cost(validator: Validator) -> int:
+    """Rough relative cost of a field validator, used to order fields in fail-fast mode"""
+    if isinstance(validator, (BooleanValidator, NumberValidator)):
+        return 1
+    if isinstance(validator, (ObjectValidator, ArrayValidator)):
+        return 8
+    if isinstance(validator, CustomValidator):
+        return 10
+    return 5
+
+def _compile_field_checks(schema: Dict[str, Validator],
+                          fail_fast: bool = False) -> Callable[[Dict[str, Any], str, ValidationResult], None]:
+    """Generate a function that validates the fields of an object schema in one straight-line body
+    
+    The field loop of ObjectValidator.validate() is unrolled at schema construction time:
+    field names, validators and their bound validate() methods become closure constants,
+    so validation does no dict iteration, tuple unpacking or method lookup. Empty values
+    (None or '') are checked against a built-in child's required flag without calling it, and
+    string fields holding a non-empty str run the child's generated checks directly. Child required
+    flags and generated checks are still read on every call, and configuring a child
+    mutates it in place, so configuring a child after the object schema is built keeps working.
+    
+    A plain dict that has every schema field (the common case) is read with one
+    operator.itemgetter call; objects with missing fields and dict subclasses (whose
+    __getitem__ may differ from `in`, e.g. defaultdict) check each key individually.
+    
+    With fail_fast, fields are checked cheapest first and the function returns after the
+    first field that fails.
+    """
+    fields = list(schema.items())
+    if fail_fast:
+        fields.sort(key=lambda field: _field_check_cost(field[1]))  # Stable: declared order breaks ties
+    params = ["_get_fields"]
+    all_present = []   # Checks when every field is present, indented for the itemgetter path
+    per_key = []       # Checks that look each key up first
+    for i, (_, validator) in enumerate(fields):
+        params += [f"_key{i}", f"_name{i}", f"_validator{i}", f"_validate{i}", f"_missing{i}"]
+        check = f"""field_result = _validate{i}(field_value{i}, current_field_name)
+if not field_result.is_valid:
+    result.errors.extend(field_result.errors)
+    result.is_valid = False
+if field_result.warnings:
+    result.warnings.extend(field_result.warnings)
+"""
+        if type(validator) in _BUILTIN_VALIDATOR_TYPES:
+            # Built-in validators all start with _handle_optional(), so empty values can be
+            # settled here; subclasses may treat them differently and are always called
+            string_branch = ""
+            if type(validator) is StringValidator:
+                # A non-empty str passes the child's optional and type checks, so its generated
+                # checks can report straight into this result without a child ValidationResult
+                string_branch = f"""elif type(field_value{i}) is str:
+    (_validator{i}._checks or _validator{i}._compile_checks())(field_value{i}, current_field_name, result)
+"""
+            check = f"""if field_value{i} is None or (type(field_value{i}) is str and not field_value{i}):
+    # No value (None or ''): handled here as the child's _handle_optional() would, without
+    # building a child result - valid if optional, a REQUIRED error otherwise
+    if _validator{i}._required:
+        result.add_error(current_field_name, _validator{i}._required_message(current_field_name), field_value{i}, "REQUIRED")
+{string_branch}else:
+{_indent(check, 1)}"""
+        present = f"current_field_name = prefix + _name{i}\n" + check
+        stop = "if not result.is_valid:\n    return\n" if fail_fast else ""
+        all_present.append(present + stop)
+        per_key.append(f"""if _key{i} in value:
+    field_value{i} = value[_key{i}]
+{_indent(present, 1)}elif _validator{i}._required:
+    result.add_error(prefix + _name{i}, _missing{i}, None, "MISSING_FIELD")
+""" + stop)
+    body = "prefix = field_name + '.' if field_name else ''\n"
+    if fields:
+        # itemgetter returns a bare value for a single key and a tuple for several
+        targets = "field_value0" if len(fields) == 1 else ", ".join(f"field_value{i}" for i in range(len(fields))) + ","
+        body += f"""if type(value) is dict:
+    try:
+        {targets} = _get_fields(value)
+    except KeyError:
+        pass
+    else:
+{_indent("".join(all_present), 2)}        return
+{"".join(per_key)}"""
+    source = f"""
+def _make_field_checks({', '.join(params)}):
+    def _validate_fields(value, field_name, result):
+{_indent(body, 2)}    return _validate_fields
+"""
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<object schema>", "exec"), namespace)
+    args = [operator.itemgetter(*(schema_field_name for schema_field_name, _ in fields)) if fields else None]
+    for schema_field_name, validator in fields:
+        # Field paths are built by concatenation, so non-str keys are formatted once here
+        args += [schema_field_name, f"{schema_field_name}", validator, validator.validate,
+                 f"Missing required field: {schema_field_name}"]
+    return namespace["_make_field_checks"](*args)
+
+def _indent(source: str, levels: int) -> str:
+    """Indent every line of generated source by the given number of 4-space levels"""
+    return "".join("    " * levels + line if line.strip() else line
+                   for line in source.splitlines(keepends=True))
+
 class ArrayValidator(Validator[List[T]]):
     """Enhanced array validator with length constraints and unique items"""
+    __slots__ = ('_item_validator', '_min_length', '_max_length', '_unique',
+                 '_numeric_fast_path', '_string_items')
     
     def __init__(self, item_validator: Validator[T]):
         """Initialize array validator with item validator"""
@@ -446,6 +849,9 @@ class ArrayValidator(Validator[List[T]]):
         self._min_length: Optional[int] = None        # Minimum array length
         self._max_length: Optional[int] = None        # Maximum array length
         self._unique: bool = False                    # Whether items must be unique
+        # Plain number items can be pre-screened in bulk with NumPy (when installed)
+        self._numeric_fast_path: bool = type(item_validator) is NumberValidator
+        self._string_items: bool = type(item_validator) is StringValidator  # Plain strings
     
     def min_length(self, length: int) -> 'ArrayValidator[T]':
         """Set minimum array length requirement"""
@@ -462,6 +868,11 @@ class ArrayValidator(Validator[List[T]]):
         self._unique = unique
         return self
     
+    def compile(self) -> 'ArrayValidator[T]':
+        """Prepare the item validator for repeated validation"""
+        self._item_validator.compile()
+        return self
+    
     def validate(self, value: Any, field_name: str = "") -> ValidationResult:
         """Validate an array against all configured rules"""
         # Handle optional fields first
@@ -472,7 +883,7 @@ class ArrayValidator(Validator[List[T]]):
         result = ValidationResult(True)
         
         # Type checking - ensure value is a list
-        if not isinstance(value, list):
+        if type(value) is not list and not isinstance(value, list):
             result.add_error(field_name, self._custom_message or "Value must be an array", value, "TYPE_ERROR")
             return result
         
@@ -484,18 +895,38 @@ class ArrayValidator(Validator[List[T]]):
         if self._max_length is not None and len(value) > self._max_length:
             result.add_error(field_name, f"Array must have at most {self._max_length} items", value, "MAX_LENGTH")
         
-        # Unique items validation - check for duplicates
+        # Unique items validation - one C-level set build settles the common all-unique case
         if self._unique:
-            seen = set()
-            for i, item in enumerate(value):
-                if item in seen:
-                    result.add_error(field_name, f"Duplicate item at index {i}", item, "DUPLICATE_ITEM")
-                seen.add(item)
+            try:
+                has_duplicates = len(set(value)) != len(value)
+            except TypeError:
+                has_duplicates = True  # Unhashable items - let the scan below compare them
+            if has_duplicates:
+                self._add_duplicate_errors(value, field_name, result)
         
-        # Validate each item in the array
-        for i, item in enumerate(value):
+        # Items of a string validator without rules only need to be non-empty strings - two
+        # C-level passes settle that for the whole array, with no per-item result
+        if (self._string_items and not self._item_validator._has_constraints()
+                and set(map(type, value)) == {str} and all(value)):
+            return result
+        
+        # Validate each item in the array - large numeric arrays are pre-screened with NumPy
+        # so only the items that can fail go through the item validator
+        indices = None
+        if self._numeric_fast_path and len(value) >= _VECTORIZE_MIN_ITEMS:
+            indices = self._numeric_failure_indices(value)
+        # Non-empty str items of a string validator run its generated checks straight into this
+        # result, as object fields do (see _compile_field_checks) - no per-item result is built
+        string_checks = None
+        if self._string_items:
+            string_checks = self._item_validator._checks or self._item_validator._compile_checks()
+        for i in range(len(value)) if indices is None else indices:
+            item = value[i]
             # Build field path for item validation
             item_field_name = f"{field_name}[{i}]" if field_name else f"[{i}]"
+            if string_checks is not None and type(item) is str and item:
+                string_checks(item, item_field_name, result)
+                continue
             item_result = self._item_validator.validate(item, item_field_name)
             if not item_result.is_valid:
                 # Add all errors from item validation
@@ -505,15 +936,90 @@ class ArrayValidator(Validator[List[T]]):
             result.warnings.extend(item_result.warnings)
         
         return result
+    
+    def _add_duplicate_errors(self, value: List[Any], field_name: str, result: ValidationResult):
+        """Report every item that repeats an earlier one (unhashable items are compared by equality)"""
+        seen = set()
+        seen_unhashable = []
+        for i, item in enumerate(value):
+            try:
+                duplicate = item in seen
+                seen.add(item)
+            except TypeError:
+                duplicate = item in seen_unhashable
+                seen_unhashable.append(item)
+            if duplicate:
+                result.add_error(field_name, f"Duplicate item at index {i}", item, "DUPLICATE_ITEM")
+    
+    def _numeric_failure_indices(self, value: List[Any]) -> Optional[List[int]]:
+        """Find the items that may fail a plain number validator using NumPy
+
+        Returns None when the fast path does not apply (NumPy not installed, transforms,
+        non-numeric items, non-numeric allowed values, bounds the array's dtype cannot
+        compare exactly), in which case every item is validated individually.
+        """
+        np = _numpy()
+        if np is None:
+            return None
+        item_validator = self._item_validator
+        if item_validator._transform is not None:
+            return None
+        allowed = item_validator._allowed_values
+        if allowed is not None:
+            if not all(type(v) is int or type(v) is float for v in allowed):
+                return None  # Python equality semantics (e.g. True == 1) must apply
+            allowed = tuple(allowed)
+
+        # Check item types in one C-level pass - bools and None must take the slow path
+        item_types = set(map(type, value))
+        if item_types != {int}:
+            if item_validator._integer_only or not item_types <= {int, float}:
+                return None
+
+        numbers = np.asarray(value)
+        if numbers.dtype.kind not in 'if':
+            return None  # Ints too large for int64 end up in an object array
+
+        # NumPy compares in the array's dtype, which must not round the bounds or the items
+        limits = [limit for limit in (item_validator._min_value, item_validator._max_value) if limit is not None]
+        limits.extend(allowed or ())
+        if numbers.dtype.kind == 'i':
+            exact = all(type(limit) is int and -2 ** 63 <= limit < 2 ** 63 for limit in limits)
+        else:
+            exact = all(type(limit) is float or (type(limit) is int and abs(limit) <= _FLOAT_EXACT_INT_MAX)
+                        for limit in limits)
+        if not exact:
+            return None
+        if len(item_types) > 1 and np.abs(numbers).max() >= _FLOAT_EXACT_INT_MAX:
+            return None  # Large ints among floats may have been rounded by the conversion
+
+        failing = np.zeros(len(numbers), dtype=bool)
+        if item_validator._min_value is not None:
+            failing |= numbers < item_validator._min_value
+        if item_validator._max_value is not None:
+            failing |= numbers > item_validator._max_value
+        if allowed is not None:
+            failing |= ~np.isin(numbers, allowed)
+        return np.flatnonzero(failing).tolist()
 
 class IPAddressValidator(Validator[str]):
     """Validator for IP addresses (IPv4 and IPv6)"""
+    __slots__ = ('_allow_ipv4', '_allow_ipv6', '_error_message', '_check')
     
     def __init__(self, allow_ipv4: bool = True, allow_ipv6: bool = True):
         """Initialize IP address validator"""
         super().__init__()
         self._allow_ipv4 = allow_ipv4
         self._allow_ipv6 = allow_ipv6
+        
+        allowed_types = []
+        if allow_ipv4:
+            allowed_types.append("IPv4")
+        if allow_ipv6:
+            allowed_types.append("IPv6")
+        self._error_message = f"Value must be a valid {' or '.join(allowed_types)} address"
+        # Only the enabled address families are checked - the choice is made here, not per value
+        self._check = _IP_ADDRESS_CHECKS[bool(allow_ipv4), bool(allow_ipv6)]
     
     def validate(self, value: Any, field_name: str = "") -> ValidationResult:
         """Validate an IP address"""
@@ -529,37 +1035,56 @@ class IPAddressValidator(Validator[str]):
             result.add_error(field_name, "Value must be a string", value, "TYPE_ERROR")
             return result
         
-        # IPv4 validation
-        if self._allow_ipv4:
-            ipv4_pattern = r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-            if re.match(ipv4_pattern, value):
-                return result
-        
-        # IPv6 validation
-        if self._allow_ipv6:
-            # Simpler approach: check basic IPv6 structure and validate with ipaddress module
-            try:
-                import ipaddress
-                ipaddress.IPv6Address(value)
-                return result
-            except (ImportError, ValueError):
-                # Fallback to basic pattern if ipaddress module not available
-                ipv6_pattern = r'^(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$|^(?:[0-9a-fA-F]{1,4}:){1,7}:$|^:(?::[0-9a-fA-F]{1,4}){1,7}$|^::$'
-                if re.match(ipv6_pattern, value):
-                    return result
-        
-        # If we get here, it's not a valid IP address
-        allowed_types = []
-        if self._allow_ipv4:
-            allowed_types.append("IPv4")
-        if self._allow_ipv6:
-            allowed_types.append("IPv6")
-        
-        result.add_error(field_name, f"Value must be a valid {' or '.join(allowed_types)} address", value, "INVALID_IP")
+        if not self._check(value):
+            result.add_error(field_name, self._error_message, value, "INVALID_IP")
         return result
 
+# IP checks cache verdicts per string - addresses tend to repeat across records (servers, gateways)
+
+@lru_cache(maxsize=1024)
+def _is_ipv4_address(value: str) -> bool:
+    """Check whether a string is a dotted-quad IPv4 address"""
+    return _IPV4_RE.fullmatch(value) is not None
+
+@lru_cache(maxsize=1024)
+def _is_ipv6_address(value: str) -> bool:
+    """Check whether a string is an IPv6 address, optionally scoped (fe80::1%eth0)"""
+    if '%' in value:
+        # Scoped addresses are outside inet_pton's grammar
+        try:
+            ipaddress.IPv6Address(value)
+            return True
+        except ValueError:
+            return False
+    try:
+        socket.inet_pton(socket.AF_INET6, value)
+        return True
+    except (OSError, ValueError):
+        return False
+
+def _is_ip_address(value: str) -> bool:
+    """Check whether a string is an IPv4 or IPv6 address
+    
+    Every IPv6 address contains ':' and no IPv4 address does, so one cheap scan picks the
+    single check that can succeed.
+    """
+    return _is_ipv6_address(value) if ':' in value else _is_ipv4_address(value)
+
+def _no_ip_address(value: str) -> bool:
+    """Reject every address - neither IP version is allowed"""
+    return False
+
+# Address check for each (allow_ipv4, allow_ipv6) combination, chosen once per validator
+_IP_ADDRESS_CHECKS: Dict[Tuple[bool, bool], Callable[[str], bool]] = {
+    (True, True): _is_ip_address,
+    (True, False): _is_ipv4_address,
+    (False, True): _is_ipv6_address,
+    (False, False): _no_ip_address,
+}
+
 class PhoneNumberValidator(Validator[str]):
     """Validator for phone numbers with international format support"""
+    __slots__ = ('_country_code',)
     
     def __init__(self, country_code: Optional[str] = None):
         """Initialize phone number validator"""
@@ -580,20 +1105,56 @@ class PhoneNumberValidator(Validator[str]):
             result.add_error(field_name, "Value must be a string", value, "TYPE_ERROR")
             return result
         
-        # Remove common separators and spaces
-        cleaned = re.sub(r'[\s\-\(\)\.]', '', value)
-        
-        # Basic phone number pattern (7-15 digits, optionally starting with +)
-        phone_pattern = r'^\+?[1-9]\d{6,14}$'
-        if not re.match(phone_pattern, cleaned):
+        if not _is_phone_number(value):
             result.add_error(field_name, "Invalid phone number format", value, "INVALID_PHONE")
         
         return result
 
+@lru_cache(maxsize=1024)
+def _is_phone_number(value: str) -> bool:
+    """Check a string against the basic phone number format, caching verdicts per string"""
+    # 7-15 digits, optionally starting with +, first digit 1-9. Stripping separators never
+    # lengthens the string, so short values are rejected before the translate pass.
+    if len(value) < 7:
+        return False
+    # Remove common separators and spaces
+    cleaned = value.translate(_PHONE_STRIP_TABLE)
+    digits = cleaned[1:] if cleaned.startswith('+') else cleaned
+    return 7 <= len(digits) <= 15 and digits.isdecimal() and '1' <= digits[0] <= '9'
+
+class UUIDValidator(Validator[str]):
+    """Validator for UUIDs in canonical 8-4-4-4-12 lowercase hex form"""
+    __slots__ = ()
+    
+    def validate(self, value: Any, field_name: str = "") -> ValidationResult:
+        """Validate a UUID string"""
+        # Handle optional fields first
+        optional_result = self._handle_optional(value, field_name)
+        if optional_result is not None:
+            return optional_result
+        
+        result = ValidationResult(True)
+        
+        # Type checking
+        if not isinstance(value, str):
+            result.add_error(field_name, self._custom_message or "Value must be a string", value, "TYPE_ERROR")
+            return result
+        
+        # Fixed layout: 36 characters with hyphens at positions 8, 13, 18 and 23 (cheap checks
+        # reject most bad input), then the 32 remaining characters must all be hex digits.
+        # Removing only 4 hyphens leaves any extra hyphen behind to fail the hex check.
+        if not (len(value) == 36 and value[8] == '-' and value[13] == '-' and value[18] == '-'
+                and value[23] == '-' and _UUID_HEX_DIGITS.issuperset(value.replace('-', '', 4))):
+            result.add_error(field_name, self._custom_message or "Invalid UUID format", value, "INVALID_UUID")
+        
+        return result
+
 class CustomValidator(Validator[Any]):
     """Validator that uses a custom validation function"""
+    __slots__ = ('_validation_func', '_apply')
     
-    def __init__(self, validation_func: Callable[[Any], Union[bool, str, Tuple[bool, str]]]):
+    def __init__(self, validation_func: Callable[[Any], Union[bool, str, Tuple[bool, str]]],
+                 mode: Optional[str] = None):
         """Initialize custom validator with validation function
         
         Args:
@@ -601,9 +1162,19 @@ class CustomValidator(Validator[Any]):
                 - bool: True if valid, False if invalid
                 - str: Error message if invalid, empty string if valid
                 - Tuple[bool, str]: (is_valid, error_message)
+            mode: 'bool', 'msg' or 'pair' to declare the return shape up front, in which case
+                the result is used without inspecting its type; None detects it on the first call
         """
         super().__init__()
         self._validation_func = validation_func
+        # Result handler specialized to the return shape (declared, or seen on the first call).
+        # Stored as a plain function (not a bound method) so copies made by _configurable() stay correct.
+        if mode is None:
+            self._apply = None
+        elif mode in _CUSTOM_MODE_HANDLERS:
+            self._apply = _CUSTOM_MODE_HANDLERS[mode]
+        else:
+            raise ValueError(f"Unknown custom validator mode: {mode!r} (expected 'bool', 'msg' or 'pair')")
     
     def validate(self, value: Any, field_name: str = "") -> ValidationResult:
         """Validate using custom function"""
@@ -616,24 +1187,108 @@ class CustomValidator(Validator[Any]):
         
         try:
             validation_result = self._validation_func(value)
-            
-            if isinstance(validation_result, bool):
-                if not validation_result:
-                    result.add_error(field_name, self._custom_message or "Custom validation failed", value, "CUSTOM_VALIDATION")
-            elif isinstance(validation_result, str):
-                if validation_result:  # Non-empty string means error
-                    result.add_error(field_name, validation_result, value, "CUSTOM_VALIDATION")
-            elif isinstance(validation_result, tuple) and len(validation_result) == 2:
-                is_valid, error_message = validation_result
-                if not is_valid:
-                    result.add_error(field_name, error_message or "Custom validation failed", value, "CUSTOM_VALIDATION")
-            else:
-                result.add_error(field_name, "Invalid validation function return type", value, "VALIDATION_ERROR")
-                
+            apply = self._apply or CustomValidator._apply_any
+            apply(self, result, validation_result, value, field_name)
         except Exception as e:
-            result.add_error(field_name, f"Validation function error: {str(e)}", value, "VALIDATION_ERROR")
+            # Built per failure rather than shared: the message, field path and value differ per call
+            result.add_error(field_name, f"Validation function error: {e}", value, "VALIDATION_ERROR")
         
         return result
+    
+    def _apply_bool(self, result: ValidationResult, validation_result: Any, value: Any, field_name: str) -> None:
+        """Record the outcome of a validation function returning a bool"""
+        if validation_result is True:
+            return
+        if validation_result is False:
+            result.add_error(field_name, self._custom_message or "Custom validation failed", value, "CUSTOM_VALIDATION")
+        else:
+            self._apply_any(result, validation_result, value, field_name)
+    
+    def _apply_str(self, result: ValidationResult, validation_result: Any, value: Any, field_name: str) -> None:
+        """Record the outcome of a validation function returning an error message"""
+        if type(validation_result) is not str:
+            self._apply_any(result, validation_result, value, field_name)
+        elif validation_result:  # Non-empty string means error
+            result.add_error(field_name, validation_result, value, "CUSTOM_VALIDATION")
+    
+    def _apply_tuple(self, result: ValidationResult, validation_result: Any, value: Any, field_name: str) -> None:
+        """Record the outcome of a validation function returning (is_valid, error_message)"""
+        if type(validation_result) is not tuple or len(validation_result) != 2:
+            self._apply_any(result, validation_result, value, field_name)
+            return
+        is_valid, error_message = validation_result
+        if not is_valid:
+            result.add_error(field_name, error_message or "Custom validation failed", value, "CUSTOM_VALIDATION")
+    
+    def _apply_any(self, result: ValidationResult, validation_result: Any, value: Any, field_name: str) -> None:
+        """Dispatch on the return shape and remember it for the following calls"""
+        if isinstance(validation_result, bool):
+            self._apply = CustomValidator._apply_bool
+            if not validation_result:
+                result.add_error(field_name, self._custom_message or "Custom validation failed", value, "CUSTOM_VALIDATION")
+        elif isinstance(validation_result, str):
+            self._apply = CustomValidator._apply_str
+            if validation_result:  # Non-empty string means error
+                result.add_error(field_name, validation_result, value, "CUSTOM_VALIDATION")
+        elif isinstance(validation_result, tuple) and len(validation_result) == 2:
+            self._apply = CustomValidator._apply_tuple
+            is_valid, error_message = validation_result
+            if not is_valid:
+                result.add_error(field_name, error_message or "Custom validation failed", value, "CUSTOM_VALIDATION")
+        else:
+            result.add_error(field_name, "Invalid validation function return type", value, "VALIDATION_ERROR")
+    
+    def _apply_truthy(self, result: ValidationResult, validation_result: Any, value: Any, field_name: str) -> None:
+        """Record the outcome of a declared bool function - any falsy result fails"""
+        if not validation_result:
+            result.add_error(field_name, self._custom_message or "Custom validation failed", value, "CUSTOM_VALIDATION")
+    
+    def _apply_message(self, result: ValidationResult, validation_result: Any, value: Any, field_name: str) -> None:
+        """Record the outcome of a declared message function - any non-empty result is the error"""
+        if validation_result:
+            result.add_error(field_name, validation_result, value, "CUSTOM_VALIDATION")
+    
+    def _apply_pair(self, result: ValidationResult, validation_result: Any, value: Any, field_name: str) -> None:
+        """Record the outcome of a declared (is_valid, error_message) function"""
+        is_valid, error_message = validation_result
+        if not is_valid:
+            result.add_error(field_name, error_message or "Custom validation failed", value, "CUSTOM_VALIDATION")
+
+# Result handlers for the return shapes declared through Schema.custom_bool/custom_msg/custom_pair
+_CUSTOM_MODE_HANDLERS: Dict[str, Callable[..., None]] = {
+    'bool': CustomValidator._apply_truthy,
+    'msg': CustomValidator._apply_message,
+    'pair': CustomValidator._apply_pair,
+}
+
+# Validator classes whose validate() starts with _handle_optional() - the generated object
+# field checks handle None and '' for these without calling validate()
+_BUILTIN_VALIDATOR_TYPES: FrozenSet[type] = frozenset({
+    StringValidator, NumberValidator, BooleanValidator, DateValidator, ObjectValidator, ArrayValidator,
+    IPAddressValidator, PhoneNumberValidator, UUIDValidator, CustomValidator,
+})
+
+def _new_email_validator() -> StringValidator:
+    """Build the validator behind Schema.email()"""
+    validator = StringValidator().fullmatch_pattern(_EMAIL_RE).with_message("Invalid email format")
+    # Keep reporting the anchored pattern the email validator has always shown in PATTERN_MISMATCH
+    validator._pattern_message = r"String must match pattern: ^[^\s@]+@[^\s@]+\.[^\s@]+$"
+    return validator
+
+def _new_url_validator() -> StringValidator:
+    """Build the validator behind Schema.url()"""
+    return StringValidator().prefix_any(('http://', 'https://')).with_message("Invalid URL format")
+
+@lru_cache(maxsize=128)
+def _shared_validator(factory: Callable[..., Validator], *args: Any) -> Validator:
+    """Build a validator once per factory and arguments, then hand out the same instance
+    
+    The instance is marked shared, so configuration methods called on it return a copy
+    and it stays valid for every caller.
+    """
+    validator = factory(*args)
+    validator._shared = True
+    return validator
 
 class Schema:
     """Enhanced Schema Builder with additional validator types"""
@@ -670,58 +1325,92 @@ class Schema:
     
     @staticmethod
     def email() -> StringValidator:
-        """Create an email validator with built-in email pattern"""
-        return StringValidator().pattern(r'^[^\s@]+@[^\s@]+\.[^\s@]+$').with_message("Invalid email format")
+        """Get the shared email validator with built-in email pattern"""
+        return _shared_validator(_new_email_validator)
     
     @staticmethod
     def url() -> StringValidator:
-        """Create a URL validator with built-in URL pattern"""
-        return StringValidator().pattern(r'^https?://.+').with_message("Invalid URL format")
+        """Get the shared URL validator with built-in URL pattern"""
+        return _shared_validator(_new_url_validator)
     
     @staticmethod
-    def uuid() -> StringValidator:
-        """Create a UUID validator with built-in UUID pattern"""
-        return StringValidator().pattern(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$').with_message("Invalid UUID format")
+    def uuid() -> 'UUIDValidator':
+        """Get the shared UUID validator"""
+        return _shared_validator(UUIDValidator)
     
     @staticmethod
     def ip_address(allow_ipv4: bool = True, allow_ipv6: bool = True) -> IPAddressValidator:
-        """Create an IP address validator"""
-        return IPAddressValidator(allow_ipv4, allow_ipv6)
+        """Get the shared IP address validator for the given protocol options"""
+        return _shared_validator(IPAddressValidator, allow_ipv4, allow_ipv6)
     
     @staticmethod
     def phone_number(country_code: Optional[str] = None) -> PhoneNumberValidator:
-        """Create a phone number validator"""
-        return PhoneNumberValidator(country_code)
+        """Get the shared phone number validator for the given country code"""
+        return _shared_validator(PhoneNumberValidator, country_code)
     
     @staticmethod
     def custom(validation_func: Callable[[Any], Union[bool, str, Tuple[bool, str]]]) -> CustomValidator:
         """Create a custom validator with a validation function"""
         return CustomValidator(validation_func)
+    
+    @staticmethod
+    def custom_bool(validation_func: Callable[[Any], bool]) -> CustomValidator:
+        """Create a custom validator whose function returns True (valid) or False (invalid)"""
+        return CustomValidator(validation_func, mode='bool')
+    
+    @staticmethod
+    def custom_msg(validation_func: Callable[[Any], str]) -> CustomValidator:
+        """Create a custom validator whose function returns an error message, or '' when valid"""
+        return CustomValidator(validation_func, mode='msg')
+    
+    @staticmethod
+    def custom_pair(validation_func: Callable[[Any], Tuple[bool, str]]) -> CustomValidator:
+        """Create a custom validator whose function returns (is_valid, error_message)"""
+        return CustomValidator(validation_func, mode='pair')
 
 
-# Enhanced schema examples demonstrating complex validation scenarios
-address_schema = Schema.object({
-    'street': Schema.string().min_length(1).max_length(100),  # Street address with length constraints
-    'city': Schema.string().min_length(1).max_length(50),     # City name with length constraints
-    'postalCode': Schema.string().pattern(r'^\d{5}$').with_message('Postal code must be 5 digits'),  # 5-digit postal code
-    'country': Schema.string().allowed_values(['USA', 'Canada', 'UK', 'Germany', 'France']),  # Allowed countries
-    'coordinates': Schema.object({  # Optional nested coordinates object
-        'lat': Schema.number().min_value(-90).max_value(90),   # Latitude range
-        'lng': Schema.number().min_value(-180).max_value(180)  # Longitude range
-    }).optional()
-})
+# Enhanced schema examples demonstrating complex validation scenarios.
+# They are built on first use (not at import time) and cached afterwards.
+def _new_address_schema() -> ObjectValidator:
+    """Build the example address schema"""
+    return Schema.object({
+        'street': Schema.string().min_length(1).max_length(100),  # Street address with length constraints
+        'city': Schema.string().min_length(1).max_length(50),     # City name with length constraints
+        'postalCode': Schema.string().pattern(r'^\d{5}$').with_message('Postal code must be 5 digits'),  # 5-digit postal code
+        'country': Schema.string().allowed_values(['USA', 'Canada', 'UK', 'Germany', 'France']),  # Allowed countries
+        'coordinates': Schema.object({  # Optional nested coordinates object
+            'lat': Schema.number().min_value(-90).max_value(90),   # Latitude range
+            'lng': Schema.number().min_value(-180).max_value(180)  # Longitude range
+        }).optional()
+    })
 
-user_schema = Schema.object({
-    'id': Schema.string().with_message('ID must be a string'),  # User ID
-    'name': Schema.string().min_length(2).max_length(50).trim(),  # Name with trimming
-    'email': Schema.email(),  # Email validation
-    'age': Schema.number().min_value(0).max_value(150).integer_only().optional(),  # Optional age
-    'isActive': Schema.boolean(),  # Active status
-    'tags': Schema.array(Schema.string()).min_length(1).max_length(10).unique(),  # Unique tags
-    'address': address_schema.optional(),  # Optional address
-    'metadata': Schema.object({}).optional(),  # Optional metadata object
-    'createdAt': Schema.date().format('%Y-%m-%d %H:%M:%S').optional()  # Optional creation date
-})
+@lru_cache(maxsize=1)
+def get_address_schema() -> ObjectValidator:
+    """Get the example address schema"""
+    return _new_address_schema()
+
+@lru_cache(maxsize=1)
+def get_user_schema() -> ObjectValidator:
+    """Get the example user schema (with an optional nested address)"""
+    return Schema.object({
+        'id': Schema.string().with_message('ID must be a string'),  # User ID
+        'name': Schema.string().min_length(2).max_length(50).trim(),  # Name with trimming
+        'email': Schema.email(),  # Email validation
+        'age': Schema.number().min_value(0).max_value(150).integer_only().optional(),  # Optional age
+        'isActive': Schema.boolean(),  # Active status
+        'tags': Schema.array(Schema.string()).min_length(1).max_length(10).unique(),  # Unique tags
+        'address': _new_address_schema().optional(),  # Optional address
+        'metadata': Schema.object({}).optional(),  # Optional metadata object
+        'createdAt': Schema.date().format('%Y-%m-%d %H:%M:%S').optional()  # Optional creation date
+    })
+
+def __getattr__(name: str) -> Any:
+    """Keep the former module-level address_schema/user_schema names importable"""
+    if name == 'address_schema':
+        return get_address_schema()
+    if name == 'user_schema':
+        return get_user_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     # Test with valid data demonstrating all validation features
@@ -746,6 +1435,7 @@ if __name__ == "__main__":
     }
     
     print("--- Testing enhanced valid data ---")
+    user_schema = get_user_schema()
     result = user_schema.validate(user_data)
     
     if result.is_valid:
@@ -869,4 +1559,28 @@ if __name__ == "__main__":
     else:
         print("❌ Network device validation failed:")
         for error in device_result.errors:
-            print(f"  - {error.field}: {error.message} (code: {error.code})") 
\ No newline at end of file
+            print(f"  - {error.field}: {error.message} (code: {error.code})")
+
+    # Optional micro-benchmark: SCHEMA_BENCH=1 python schema.py
+    # Reuses the validators built above so the timings cover validate() only, not construction.
+    import os
+    if os.environ.get("SCHEMA_BENCH") == "1":
+        import time
+
+        iterations = 10_000
+        bench_cases = [
+            ("ip_address", ip_validator, ['192.168.1.1', '256.1.2.3', '2001:db8::1']),
+            ("phone_number", phone_validator, ['+1-234-567-8900', '123']),
+            ("custom (even)", even_validator, [4, 3]),
+            ("network device", network_device_schema, [device_data]),
+            ("user (valid)", user_schema, [user_data]),
+            ("user (invalid)", user_schema, [invalid_data]),
+        ]
+
+        print(f"\n--- Benchmark ({iterations:,} iterations per input) ---")
+        for label, validator, inputs in bench_cases:
+            bench_inputs = inputs * iterations
+            start = time.perf_counter()
+            list(map(validator.validate, bench_inputs))
+            elapsed = time.perf_counter() - start
+            print(f"{label:<16} {elapsed * 1e6 / len(bench_inputs):8.2f} µs/validate")
@@ -1,26 +1,77 @@
+import pickle
+import re
 import unittest
+from collections import defaultdict
 from datetime import datetime, timedelta
+
+import pytest
+
 from schema import (
     Schema, ValidationResult, ValidationError, ValidationLevel,
     StringValidator, NumberValidator, BooleanValidator, DateValidator,
-    ObjectValidator, ArrayValidator
+    ObjectValidator, ArrayValidator, UUIDValidator, CustomValidator, Validator
 )
 
 
+# Regex patterns for the string tests and complex schemas, compiled once at import
+_RE_SSN = re.compile(r'^\d{3}-\d{2}-\d{4}$')
+_RE_PHONE = re.compile(r'^\+?[\d\s\-\(\)]+$')
+_RE_USERNAME = re.compile(r'^[a-zA-Z0-9_]+$')
+
+# Plain type validators, shared wherever they are used unconfigured. Chaining a rule onto
+# one of these would modify it for every test, so configured validators are built fresh.
+_STR = Schema.string()
+_NUM = Schema.number()
+_BOOL = Schema.boolean()
+
+# Built-in factory validators, used read-only (only .validate() is called on them)
+EMAIL = Schema.email()
+URL = Schema.url()
+UUID = Schema.uuid()
+
+
+# Validators shared by the parametrized tests - built once per module
+@pytest.fixture(scope="module")
+def number_validator():
+    return _NUM
+
+
+@pytest.fixture(scope="module")
+def boolean_validator():
+    return _BOOL
+
+
+@pytest.fixture(scope="module")
+def date_validator():
+    return Schema.date()
+
+
+@pytest.fixture(scope="module")
+def string_array_validator():
+    return Schema.array(_STR)
+
+
+@pytest.fixture(scope="module")
+def name_object_validator():
+    return Schema.object({'name': _STR})
+
+
 class TestStringValidator(unittest.TestCase):
     """Test cases for StringValidator"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.string_validator = _STR
+
     def test_valid_string(self):
         """Test basic string validation"""
-        validator = Schema.string()
-        result = validator.validate("hello")
+        result = self.string_validator.validate("hello")
         self.assertTrue(result.is_valid)
         self.assertEqual(len(result.errors), 0)
 
     def test_invalid_type(self):
         """Test string validator with non-string input"""
-        validator = Schema.string()
-        result = validator.validate(123)
+        result = self.string_validator.validate(123)
         self.assertFalse(result.is_valid)
         self.assertEqual(len(result.errors), 1)
         self.assertEqual(result.errors[0].code, "TYPE_ERROR")
@@ -52,17 +103,83 @@ class TestStringValidator(unittest.TestCase):
         self.assertEqual(result.errors[0].code, "MAX_LENGTH")
 
     def test_pattern_matching(self):
-        """Test regex pattern validation"""
-        validator = Schema.string().pattern(r'^\d{3}-\d{2}-\d{4}$')
+        """Test regex pattern validation (pre-compiled and from a pattern string)"""
+        for validator in (Schema.string().pattern(_RE_SSN), Schema.string().pattern(_RE_SSN.pattern)):
+            # Valid case
+            result = validator.validate("123-45-6789")
+            self.assertTrue(result.is_valid)
+            
+            # Invalid case
+            result = validator.validate("123456789")
+            self.assertFalse(result.is_valid)
+            self.assertEqual(result.errors[0].code, "PATTERN_MISMATCH")
+
+    def test_fullmatch_pattern(self):
+        """Test whole-string pattern validation without anchors"""
+        validator = Schema.string().fullmatch_pattern(r'[a-z]+\d')
         
         # Valid case
-        result = validator.validate("123-45-6789")
+        result = validator.validate("abc1")
         self.assertTrue(result.is_valid)
         
-        # Invalid case
-        result = validator.validate("123456789")
+        # Invalid cases (a prefix match is not enough)
+        for value in ["abc1x", "1abc1"]:
+            result = validator.validate(value)
+            self.assertFalse(result.is_valid)
+            self.assertEqual(result.errors[0].code, "PATTERN_MISMATCH")
+
+    def test_fixed_digit_pattern(self):
+        """Test fixed-length digit patterns such as postal codes"""
+        validator = Schema.string().pattern(r'^\d{5}$')
+        
+        # Valid case
+        result = validator.validate("12345")
+        self.assertTrue(result.is_valid)
+        
+        # Invalid cases
+        for value in ["1234", "123456", "1234a"]:
+            result = validator.validate(value)
+            self.assertFalse(result.is_valid)
+            self.assertEqual(result.errors[0].code, "PATTERN_MISMATCH")
+
+    def test_reconfigure_after_validate(self):
+        """Test rules added after the first validation are applied"""
+        validator = Schema.string()
+        self.assertTrue(validator.validate("abc").is_valid)
+
+        validator.min_length(5).trim()
+        result = validator.validate("  abc  ")
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors[0].code, "MIN_LENGTH")
+
+    def test_precompiled_pattern(self):
+        """Test pattern validation with a pre-compiled regex"""
+        validator = Schema.string().pattern(re.compile(r'^[A-Z]{3}$'))
+        
+        # Valid case
+        result = validator.validate("ABC")
+        self.assertTrue(result.is_valid)
+        
+        # Invalid case reports the pattern source
+        result = validator.validate("abc")
         self.assertFalse(result.is_valid)
         self.assertEqual(result.errors[0].code, "PATTERN_MISMATCH")
+        self.assertEqual(result.errors[0].message, "String must match pattern: ^[A-Z]{3}$")
+
+    def test_prefix_any(self):
+        """Test prefix validation"""
+        validator = Schema.string().prefix_any(('http://', 'https://'))
+        
+        # Valid cases
+        for value in ["http://a", "https://example.com"]:
+            result = validator.validate(value)
+            self.assertTrue(result.is_valid)
+        
+        # Invalid cases (wrong prefix, nothing after the prefix, or a newline right after it)
+        for value in ["ftp://example.com", "http://", "https://", "http://\n", "http://\nx"]:
+            result = validator.validate(value)
+            self.assertFalse(result.is_valid)
+            self.assertEqual(result.errors[0].code, "PATTERN_MISMATCH")
 
     def test_allowed_values(self):
         """Test allowed values validation"""
@@ -123,33 +240,13 @@ class TestStringValidator(unittest.TestCase):
 class TestNumberValidator(unittest.TestCase):
     """Test cases for NumberValidator"""
 
-    def test_valid_number(self):
-        """Test basic number validation"""
-        validator = Schema.number()
-        
-        # Valid cases
-        for num in [0, 1, -1, 3.14, 100]:
-            result = validator.validate(num)
-            self.assertTrue(result.is_valid)
-
-    def test_invalid_type(self):
-        """Test number validator with non-number input"""
-        validator = Schema.number()
-        
-        # Invalid cases
-        for value in ["123", True, False, [], {}]:
-            result = validator.validate(value)
-            self.assertFalse(result.is_valid)
-            self.assertEqual(result.errors[0].code, "TYPE_ERROR")
-
     def test_min_value(self):
         """Test minimum value validation"""
         validator = Schema.number().min_value(0)
         
         # Valid cases
-        for num in [0, 1, 100]:
-            result = validator.validate(num)
-            self.assertTrue(result.is_valid)
+        results = validator.validate_many([0, 1, 100])
+        self.assertTrue(all(r.is_valid for r in results))
         
         # Invalid case
         result = validator.validate(-1)
@@ -161,9 +258,8 @@ class TestNumberValidator(unittest.TestCase):
         validator = Schema.number().max_value(100)
         
         # Valid cases
-        for num in [0, 50, 100]:
-            result = validator.validate(num)
-            self.assertTrue(result.is_valid)
+        results = validator.validate_many([0, 50, 100])
+        self.assertTrue(all(r.is_valid for r in results))
         
         # Invalid case
         result = validator.validate(101)
@@ -175,9 +271,8 @@ class TestNumberValidator(unittest.TestCase):
         validator = Schema.number().integer_only()
         
         # Valid cases
-        for num in [0, 1, -1, 100]:
-            result = validator.validate(num)
-            self.assertTrue(result.is_valid)
+        results = validator.validate_many([0, 1, -1, 100])
+        self.assertTrue(all(r.is_valid for r in results))
         
         # Invalid case
         result = validator.validate(3.14)
@@ -189,9 +284,8 @@ class TestNumberValidator(unittest.TestCase):
         validator = Schema.number().allowed_values([1, 2, 3, 5, 8])
         
         # Valid cases
-        for num in [1, 2, 3, 5, 8]:
-            result = validator.validate(num)
-            self.assertTrue(result.is_valid)
+        results = validator.validate_many([1, 2, 3, 5, 8])
+        self.assertTrue(all(r.is_valid for r in results))
         
         # Invalid case
         result = validator.validate(4)
@@ -203,36 +297,41 @@ class TestNumberValidator(unittest.TestCase):
         validator = Schema.number().optional()
         
         # Valid cases
-        for value in [None, 0, 1, 3.14]:
-            result = validator.validate(value)
-            self.assertTrue(result.is_valid)
+        results = validator.validate_many([None, 0, 1, 3.14])
+        self.assertTrue(all(r.is_valid for r in results))
 
+    def test_validate_many(self):
+        """Test batch validation returns one result per value, in order"""
+        validator = Schema.number().min_value(0).integer_only()
+        
+        results = validator.validate_many([1, -1, 2.5, "3", 4], "count")
+        self.assertEqual([r.is_valid for r in results], [True, False, False, False, True])
+        self.assertEqual([r.errors[0].code for r in results if not r.is_valid],
+                         ["MIN_VALUE", "INTEGER_REQUIRED", "TYPE_ERROR"])
+        self.assertEqual(results[1].errors[0].field, "count")
+        
+        # Validators without a specialized batch path validate item by item
+        results = Schema.string().validate_many(["a", 1])
+        self.assertEqual([r.is_valid for r in results], [True, False])
 
-class TestBooleanValidator(unittest.TestCase):
-    """Test cases for BooleanValidator"""
 
-    def test_valid_boolean(self):
-        """Test basic boolean validation"""
-        validator = Schema.boolean()
-        
-        # Valid cases
-        for value in [True, False]:
-            result = validator.validate(value)
-            self.assertTrue(result.is_valid)
+@pytest.mark.parametrize("num", [0, 1, -1, 3.14, 100])
+def test_valid_number(number_validator, num):
+    """Test basic number validation"""
+    result = number_validator.validate(num)
+    assert result.is_valid
 
-    def test_truthy_values(self):
-        """Test truthy value conversion"""
-        validator = Schema.boolean()
-        
-        # Valid truthy values
-        for value in ["true", "1", 1, "yes", "on"]:
-            result = validator.validate(value)
-            self.assertTrue(result.is_valid, f"Failed for truthy value: {value}")
-        
-        # Valid falsy values (excluding empty string for required fields)
-        for value in ["false", "0", 0, "no", "off"]:
-            result = validator.validate(value)
-            self.assertTrue(result.is_valid, f"Failed for falsy value: {value}")
+
+@pytest.mark.parametrize("value", ["123", True, False, [], {}])
+def test_number_invalid_type(number_validator, value):
+    """Test number validator with non-number input"""
+    result = number_validator.validate(value)
+    assert not result.is_valid
+    assert result.errors[0].code == "TYPE_ERROR"
+
+
+class TestBooleanValidator(unittest.TestCase):
+    """Test cases for BooleanValidator"""
 
     def test_custom_truthy_falsy_values(self):
         """Test custom truthy/falsy values"""
@@ -241,23 +340,13 @@ class TestBooleanValidator(unittest.TestCase):
         # Valid cases
         for value in ['yes', 'y', 'no', 'n']:
             result = validator.validate(value)
-            self.assertTrue(result.is_valid, f"Failed for custom value: {value}")
+            self.assertIs(result.is_valid, True, value)
         
         # Invalid case
         result = validator.validate("maybe")
         self.assertFalse(result.is_valid)
         self.assertEqual(result.errors[0].code, "TYPE_ERROR")
 
-    def test_invalid_type(self):
-        """Test boolean validator with invalid input"""
-        validator = Schema.boolean()
-        
-        # Invalid cases
-        for value in [123, "invalid", [], {}]:
-            result = validator.validate(value)
-            self.assertFalse(result.is_valid)
-            self.assertEqual(result.errors[0].code, "TYPE_ERROR")
-
     def test_optional_boolean(self):
         """Test optional boolean validation"""
         validator = Schema.boolean().optional()
@@ -265,38 +354,47 @@ class TestBooleanValidator(unittest.TestCase):
         # Valid cases
         for value in [None, True, False, "true", "false"]:
             result = validator.validate(value)
-            self.assertTrue(result.is_valid, f"Failed for optional value: {value}")
+            self.assertIs(result.is_valid, True, value)
+
+
+@pytest.mark.parametrize("value", [True, False])
+def test_valid_boolean(boolean_validator, value):
+    """Test basic boolean validation"""
+    assert boolean_validator.validate(value).is_valid
+
+
+# Falsy values exclude the empty string, which a required field rejects
+@pytest.mark.parametrize("value", ["true", "1", 1, "yes", "on", "false", "0", 0, "no", "off"])
+def test_truthy_falsy_values(boolean_validator, value):
+    """Test truthy and falsy value conversion"""
+    assert boolean_validator.validate(value).is_valid
+
+
+@pytest.mark.parametrize("value", [123, "invalid", [], {}])
+def test_boolean_invalid_type(boolean_validator, value):
+    """Test boolean validator with invalid input"""
+    result = boolean_validator.validate(value)
+    assert not result.is_valid
+    assert result.errors[0].code == "TYPE_ERROR"
 
 
 class TestDateValidator(unittest.TestCase):
     """Test cases for DateValidator"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.date_validator = Schema.date()
+        # Fixed reference time - keeps the range tests deterministic
+        cls.now = datetime(2024, 1, 15, 10, 30, 0)
+        cls.past = cls.now - timedelta(days=365)
+        cls.future = cls.now + timedelta(days=365)
+        cls.range_validator = Schema.date().min_date(cls.past).max_date(cls.future)
+
     def test_valid_datetime_object(self):
         """Test validation with datetime object"""
-        validator = Schema.date()
-        now = datetime.now()
-        result = validator.validate(now)
+        result = self.date_validator.validate(self.now)
         self.assertTrue(result.is_valid)
 
-    def test_valid_date_string(self):
-        """Test validation with date string"""
-        validator = Schema.date()
-        
-        # Valid date strings
-        for date_str in ["2024-01-15", "2024-01-15 10:30:00", "15/01/2024"]:
-            result = validator.validate(date_str)
-            self.assertTrue(result.is_valid)
-
-    def test_invalid_date_format(self):
-        """Test invalid date format"""
-        validator = Schema.date()
-        
-        # Invalid date strings
-        for date_str in ["invalid-date", "2024/13/45", "not-a-date"]:
-            result = validator.validate(date_str)
-            self.assertFalse(result.is_valid)
-            self.assertEqual(result.errors[0].code, "DATE_FORMAT_ERROR")
-
     def test_specific_date_format(self):
         """Test specific date format validation"""
         validator = Schema.date().format('%Y-%m-%d')
@@ -312,58 +410,49 @@ class TestDateValidator(unittest.TestCase):
 
     def test_date_range_validation(self):
         """Test date range validation"""
-        now = datetime.now()
-        past_date = now - timedelta(days=365)
-        future_date = now + timedelta(days=365)
-        
-        validator = Schema.date().min_date(past_date).max_date(future_date)
-        
         # Valid case
-        result = validator.validate(now)
+        result = self.range_validator.validate(self.now)
         self.assertTrue(result.is_valid)
         
         # Invalid case (too old)
-        old_date = now - timedelta(days=400)
-        result = validator.validate(old_date)
+        result = self.range_validator.validate(self.now - timedelta(days=400))
         self.assertFalse(result.is_valid)
         self.assertEqual(result.errors[0].code, "MIN_DATE")
-
-    def test_invalid_type(self):
-        """Test date validator with invalid type"""
-        validator = Schema.date()
         
-        # Invalid cases
-        for value in [123, True, [], {}]:
-            result = validator.validate(value)
-            self.assertFalse(result.is_valid)
-            self.assertEqual(result.errors[0].code, "TYPE_ERROR")
+        # Invalid case (too far ahead)
+        result = self.range_validator.validate(self.now + timedelta(days=400))
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors[0].code, "MAX_DATE")
 
 
-class TestArrayValidator(unittest.TestCase):
-    """Test cases for ArrayValidator"""
+@pytest.mark.parametrize("date_str", ["2024-01-15", "2024-01-15 10:30:00", "15/01/2024"])
+def test_valid_date_string(date_validator, date_str):
+    """Test validation with date string"""
+    assert date_validator.validate(date_str).is_valid
 
-    def test_valid_array(self):
-        """Test basic array validation"""
-        validator = Schema.array(Schema.string())
-        
-        # Valid cases
-        for arr in [["a", "b"], [], ["single"]]:
-            result = validator.validate(arr)
-            self.assertTrue(result.is_valid)
 
-    def test_invalid_type(self):
-        """Test array validator with non-array input"""
-        validator = Schema.array(Schema.string())
-        
-        # Invalid cases
-        for value in ["not-array", 123, True, {}]:
-            result = validator.validate(value)
-            self.assertFalse(result.is_valid)
-            self.assertEqual(result.errors[0].code, "TYPE_ERROR")
+@pytest.mark.parametrize("date_str", ["invalid-date", "2024/13/45", "not-a-date"])
+def test_invalid_date_format(date_validator, date_str):
+    """Test invalid date format"""
+    result = date_validator.validate(date_str)
+    assert not result.is_valid
+    assert result.errors[0].code == "DATE_FORMAT_ERROR"
+
+
+@pytest.mark.parametrize("value", [123, True, [], {}])
+def test_date_invalid_type(date_validator, value):
+    """Test date validator with invalid type"""
+    result = date_validator.validate(value)
+    assert not result.is_valid
+    assert result.errors[0].code == "TYPE_ERROR"
+
+
+class TestArrayValidator(unittest.TestCase):
+    """Test cases for ArrayValidator"""
 
     def test_array_length_validation(self):
         """Test array length validation"""
-        validator = Schema.array(Schema.string()).min_length(2).max_length(4)
+        validator = Schema.array(_STR).min_length(2).max_length(4)
         
         # Valid cases
         for arr in [["a", "b"], ["a", "b", "c"], ["a", "b", "c", "d"]]:
@@ -381,7 +470,7 @@ class TestArrayValidator(unittest.TestCase):
 
     def test_unique_items(self):
         """Test unique items validation"""
-        validator = Schema.array(Schema.string()).unique()
+        validator = Schema.array(_STR).unique()
         
         # Valid case
         result = validator.validate(["a", "b", "c"])
@@ -392,6 +481,20 @@ class TestArrayValidator(unittest.TestCase):
         self.assertFalse(result.is_valid)
         self.assertEqual(result.errors[0].code, "DUPLICATE_ITEM")
 
+    def test_unique_unhashable_items(self):
+        """Test unique items validation with unhashable items"""
+        validator = Schema.array(Schema.object({'id': _NUM})).unique()
+        
+        # Valid case
+        result = validator.validate([{'id': 1}, {'id': 2}])
+        self.assertTrue(result.is_valid)
+        
+        # Invalid case
+        result = validator.validate([{'id': 1}, {'id': 2}, {'id': 1}])
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors[0].code, "DUPLICATE_ITEM")
+        self.assertEqual(result.errors[0].message, "Duplicate item at index 2")
+
     def test_array_item_validation(self):
         """Test validation of array items"""
         validator = Schema.array(Schema.number().min_value(0))
@@ -402,13 +505,12 @@ class TestArrayValidator(unittest.TestCase):
         
         # Invalid case (negative number)
         result = validator.validate([1, -2, 3])
-        self.assertFalse(result.is_valid)
-        self.assertEqual(result.errors[0].field, "[1]")
-        self.assertEqual(result.errors[0].code, "MIN_VALUE")
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "MIN_VALUE", "[1]"))
 
     def test_nested_array_validation(self):
         """Test nested array validation"""
-        validator = Schema.array(Schema.array(Schema.number()))
+        validator = Schema.array(Schema.array(_NUM))
         
         # Valid case
         result = validator.validate([[1, 2], [3, 4]])
@@ -416,57 +518,197 @@ class TestArrayValidator(unittest.TestCase):
         
         # Invalid case
         result = validator.validate([[1, 2], ["invalid", 4]])
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "TYPE_ERROR", "[1][0]"))
+
+    def test_large_numeric_array_validation(self):
+        """Test large numeric arrays (bulk-checked when NumPy is available)"""
+        validator = Schema.array(Schema.number().min_value(0).max_value(100))
+
+        # Valid case
+        result = validator.validate(list(range(101)))
+        self.assertTrue(result.is_valid)
+
+        # Invalid cases keep per-item field paths and error order
+        values = [float(i) for i in range(50)]
+        values[3] = -1.5
+        values[40] = 150
+        result = validator.validate(values)
         self.assertFalse(result.is_valid)
-        self.assertEqual(result.errors[0].field, "[1][0]")
-        self.assertEqual(result.errors[0].code, "TYPE_ERROR")
+        self.assertEqual([e.field for e in result.errors], ["[3]", "[40]"])
+        self.assertEqual([e.code for e in result.errors], ["MIN_VALUE", "MAX_VALUE"])
+
+        # Booleans are still rejected even though NumPy would coerce them
+        values = list(range(50))
+        values[10] = True
+        result = validator.validate(values)
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "TYPE_ERROR", "[10]"))
+
+        # Bounds and items that NumPy would round are compared exactly, item by item
+        result = Schema.array(Schema.number().max_value(2.0 ** 53)).validate([2 ** 53 + 1] * 40)
+        self.assertEqual((result.is_valid, len(result.errors)), (False, 40))
+        result = Schema.array(Schema.number().max_value(2 ** 53)).validate([0.5, 2 ** 53 + 1] * 20)
+        self.assertEqual([e.field for e in result.errors][:2], ["[1]", "[3]"])
+
+    def test_large_string_array_validation(self):
+        """Test large string arrays keep per-item field paths and error order"""
+        validator = Schema.array(Schema.string().min_length(2).max_length(10).trim())
+
+        # Valid case
+        result = validator.validate(["  developer  ", "designer"] * 100)
+        self.assertTrue(result.is_valid)
+
+        # Invalid cases keep per-item field paths and error order
+        values = ["designer"] * 200
+        values[5] = " a "
+        values[120] = ""
+        values[150] = 42
+        result = validator.validate(values)
+        self.assertFalse(result.is_valid)
+        self.assertEqual([e.field for e in result.errors], ["[5]", "[120]", "[150]"])
+        self.assertEqual([e.code for e in result.errors], ["MIN_LENGTH", "REQUIRED", "TYPE_ERROR"])
+
+    def test_plain_string_array_validation(self):
+        """Test arrays of unconstrained strings, including rules added after the array is built"""
+        item_validator = Schema.string()
+        validator = Schema.array(item_validator)
+        self.assertTrue(validator.validate(["a", " ", "tag"]).is_valid)
+
+        result = validator.validate(["a", "", None, 3])
+        self.assertEqual([e.field for e in result.errors], ["[1]", "[2]", "[3]"])
+        self.assertEqual([e.code for e in result.errors], ["REQUIRED", "REQUIRED", "TYPE_ERROR"])
+
+        item_validator.min_length(2)
+        result = validator.validate(["ab", "a"])
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "MIN_LENGTH", "[1]"))
+
+
+@pytest.mark.parametrize("arr", [["a", "b"], [], ["single"]])
+def test_valid_array(string_array_validator, arr):
+    """Test basic array validation"""
+    assert string_array_validator.validate(arr).is_valid
+
+
+@pytest.mark.parametrize("value", ["not-array", 123, True, {}])
+def test_array_invalid_type(string_array_validator, value):
+    """Test array validator with non-array input"""
+    result = string_array_validator.validate(value)
+    assert not result.is_valid
+    assert result.errors[0].code == "TYPE_ERROR"
 
 
 class TestObjectValidator(unittest.TestCase):
     """Test cases for ObjectValidator"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.person_validator = Schema.object({
+            'name': _STR,
+            'age': _NUM
+        })
+        cls.nested_validator = Schema.object({
+            'name': _STR,
+            'address': Schema.object({
+                'street': _STR,
+                'city': _STR
+            })
+        })
+        cls.deep_validator = Schema.object({
+            'level1': Schema.object({
+                'level2': Schema.object({
+                    'level3': _STR
+                })
+            })
+        })
+
     def test_valid_object(self):
         """Test basic object validation"""
-        schema = {
-            'name': Schema.string(),
-            'age': Schema.number()
-        }
-        validator = Schema.object(schema)
-        
         # Valid case
         data = {'name': 'John', 'age': 30}
-        result = validator.validate(data)
+        result = self.person_validator.validate(data)
         self.assertTrue(result.is_valid)
 
-    def test_invalid_type(self):
-        """Test object validator with non-object input"""
-        schema = {'name': Schema.string()}
-        validator = Schema.object(schema)
-        
-        # Invalid cases
-        for value in ["not-object", 123, True, []]:
-            result = validator.validate(value)
-            self.assertFalse(result.is_valid)
-            self.assertEqual(result.errors[0].code, "TYPE_ERROR")
-
     def test_missing_required_fields(self):
         """Test missing required fields"""
-        schema = {
-            'name': Schema.string(),
-            'age': Schema.number()
-        }
-        validator = Schema.object(schema)
-        
         # Missing field
         data = {'name': 'John'}
-        result = validator.validate(data)
+        result = self.person_validator.validate(data)
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "MISSING_FIELD", "age"))
+
+    def test_required_field_set_to_none(self):
+        """Test required fields explicitly set to None"""
+        validator = Schema.object({
+            'name': _STR,
+            'email': Schema.email().with_message("Email is required")
+        })
+
+        result = validator.validate({'name': None, 'email': None})
         self.assertFalse(result.is_valid)
-        self.assertEqual(result.errors[0].code, "MISSING_FIELD")
-        self.assertEqual(result.errors[0].field, "age")
+        self.assertEqual([e.code for e in result.errors], ["REQUIRED", "REQUIRED"])
+        self.assertEqual(result.errors[0].field, "name")
+        self.assertEqual(result.errors[0].message, "Field 'name' is required")
+        self.assertEqual(result.errors[1].message, "Email is required")
+
+    def test_field_names_needing_quotes(self):
+        """Test field names that are not valid identifiers"""
+        validator = Schema.object({
+            "first-name": _STR,
+            "it's": _NUM,
+            'with "quotes"\n': _BOOL
+        })
+
+        self.assertTrue(validator.validate({"first-name": "Ann", "it's": 1, 'with "quotes"\n': True}).is_valid)
+        result = validator.validate({"first-name": 5}, "outer")
+        self.assertEqual([e.field for e in result.errors], ["outer.first-name", "outer.it's", 'outer.with "quotes"\n'])
+        self.assertEqual(result.errors[1].message, "Missing required field: it's")
+
+    def test_dict_subclass_missing_field(self):
+        """Test a missing field of a defaultdict is reported, not read through its default"""
+        data = defaultdict(lambda: 'default', {'name': 'John'})
+        result = self.person_validator.validate(data)
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "MISSING_FIELD", "age"))
+        self.assertNotIn('age', data)
+
+    def test_custom_subclass_receives_empty_values(self):
+        """Test a user-defined Validator subclass decides for itself whether None is valid"""
+        class NullableValidator(Validator):
+            def validate(self, value, field_name=""):
+                return ValidationResult(value is None or isinstance(value, int))
+
+        validator = Schema.object({'a': NullableValidator()})
+        self.assertTrue(validator.validate({'a': None}).is_valid)
+        self.assertFalse(validator.validate({'a': ''}).is_valid)
+
+    def test_non_string_keys(self):
+        """Test schema keys that are not strings are formatted into field paths"""
+        validator = Schema.object({1: _STR, 2: _NUM})
+        result = validator.validate({1: 5})
+        self.assertEqual([(e.field, e.code) for e in result.errors],
+                         [("1", "TYPE_ERROR"), ("2", "MISSING_FIELD")])
+
+        result = Schema.object({'row': validator}).validate({'row': {1: 'a', 2: 'b'}})
+        self.assertEqual([e.field for e in result.errors], ["row.2"])
+
+    def test_string_field_reconfigured_after_object_built(self):
+        """Test string field rules added after the object schema was built are applied"""
+        name = Schema.string()
+        validator = Schema.object({'name': name})
+        self.assertTrue(validator.validate({'name': 'Al'}).is_valid)
+
+        name.min_length(3).trim()
+        result = validator.validate({'name': ' Al '})
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "MIN_LENGTH", "name"))
+        self.assertTrue(validator.validate({'name': ' Alice '}).is_valid)
 
     def test_optional_fields(self):
         """Test optional fields"""
         schema = {
-            'name': Schema.string(),
+            'name': _STR,
             'age': Schema.number().optional()
         }
         validator = Schema.object(schema)
@@ -481,22 +723,12 @@ class TestObjectValidator(unittest.TestCase):
 
     def test_nested_object_validation(self):
         """Test nested object validation"""
-        address_schema = {
-            'street': Schema.string(),
-            'city': Schema.string()
-        }
-        user_schema = {
-            'name': Schema.string(),
-            'address': Schema.object(address_schema)
-        }
-        validator = Schema.object(user_schema)
-        
         # Valid case
         data = {
             'name': 'John',
             'address': {'street': '123 Main St', 'city': 'Anytown'}
         }
-        result = validator.validate(data)
+        result = self.nested_validator.validate(data)
         self.assertTrue(result.is_valid)
         
         # Invalid nested field
@@ -504,14 +736,13 @@ class TestObjectValidator(unittest.TestCase):
             'name': 'John',
             'address': {'street': 123, 'city': 'Anytown'}  # street should be string
         }
-        result = validator.validate(data)
-        self.assertFalse(result.is_valid)
-        self.assertEqual(result.errors[0].field, "address.street")
-        self.assertEqual(result.errors[0].code, "TYPE_ERROR")
+        result = self.nested_validator.validate(data)
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "TYPE_ERROR", "address.street"))
 
     def test_strict_mode(self):
         """Test strict mode (no unknown fields)"""
-        schema = {'name': Schema.string()}
+        schema = {'name': _STR}
         validator = Schema.object(schema).strict()
         
         # Valid case
@@ -525,16 +756,36 @@ class TestObjectValidator(unittest.TestCase):
         self.assertFalse(result.is_valid)
         self.assertEqual(result.errors[0].code, "UNKNOWN_FIELDS")
 
+    def test_fail_fast(self):
+        """Test fail-fast mode reports only the first failing field, cheapest checks first"""
+        calls = []
+        validator = Schema.object({
+            'code': Schema.custom(lambda v: calls.append(v) or True),
+            'name': _STR,
+            'age': _NUM
+        }).fail_fast()
+
+        result = validator.validate({'code': 'x', 'name': 5, 'age': 'old'})
+        self.assertEqual([e.field for e in result.errors], ["age"])
+        self.assertEqual(calls, [])
+
+        self.assertTrue(validator.validate({'code': 'x', 'name': 'Ann', 'age': 30}).is_valid)
+        self.assertEqual(calls, ['x'])
+
+        # Switching it off restores declared order and full error reporting
+        result = validator.fail_fast(False).validate({'code': 'x', 'name': 5, 'age': 'old'})
+        self.assertEqual([e.field for e in result.errors], ["name", "age"])
+
+    def test_invalid_schema_definition(self):
+        """Test that non-validator schema fields are rejected up front"""
+        with self.assertRaises(TypeError):
+            Schema.object({'name': str})
+
     def test_field_path_tracking(self):
         """Test field path tracking in nested objects"""
-        deep_schema = {
-            'level1': Schema.object({
-                'level2': Schema.object({
-                    'level3': Schema.string()
-                })
-            })
-        }
-        validator = Schema.object(deep_schema)
+        # Valid deep field
+        result = self.deep_validator.validate({'level1': {'level2': {'level3': 'value'}}})
+        self.assertTrue(result.is_valid)
         
         # Invalid deep field
         data = {
@@ -544,148 +795,205 @@ class TestObjectValidator(unittest.TestCase):
                 }
             }
         }
-        result = validator.validate(data)
-        self.assertFalse(result.is_valid)
-        self.assertEqual(result.errors[0].field, "level1.level2.level3")
-        self.assertEqual(result.errors[0].code, "TYPE_ERROR")
+        result = self.deep_validator.validate(data)
+        self.assertEqual((result.is_valid, result.errors[0].code, result.errors[0].field),
+                         (False, "TYPE_ERROR", "level1.level2.level3"))
 
 
-class TestSchemaFactory(unittest.TestCase):
-    """Test cases for Schema factory methods"""
+@pytest.mark.parametrize("value", ["not-object", 123, True, []])
+def test_object_invalid_type(name_object_validator, value):
+    """Test object validator with non-object input"""
+    result = name_object_validator.validate(value)
+    assert not result.is_valid
+    assert result.errors[0].code == "TYPE_ERROR"
 
-    def test_email_validator(self):
-        """Test email validator factory"""
-        validator = Schema.email()
-        
-        # Valid emails
-        for email in ["test@example.com", "user.name@domain.co.uk", "a@b.c"]:
-            result = validator.validate(email)
-            self.assertTrue(result.is_valid)
-        
-        # Invalid emails
-        for email in ["invalid-email", "@domain.com", "user@", "user.domain.com"]:
-            result = validator.validate(email)
-            self.assertFalse(result.is_valid)
 
-    def test_url_validator(self):
-        """Test URL validator factory"""
-        validator = Schema.url()
-        
-        # Valid URLs
-        for url in ["http://example.com", "https://www.example.com/path", "http://localhost:3000"]:
-            result = validator.validate(url)
-            self.assertTrue(result.is_valid)
-        
-        # Invalid URLs
-        for url in ["not-a-url", "ftp://example.com", "example.com"]:
-            result = validator.validate(url)
-            self.assertFalse(result.is_valid)
+class TestSchemaFactory(unittest.TestCase):
+    """Test cases for Schema factory methods"""
 
     def test_uuid_validator(self):
         """Test UUID validator factory"""
-        validator = Schema.uuid()
-        
-        # Valid UUIDs
-        for uuid_str in [
-            "123e4567-e89b-12d3-a456-426614174000",
-            "550e8400-e29b-41d4-a716-446655440000"
-        ]:
-            result = validator.validate(uuid_str)
-            self.assertTrue(result.is_valid)
-        
-        # Invalid UUIDs
-        for uuid_str in ["not-a-uuid", "123e4567-e89b-12d3-a456", "invalid-uuid-format"]:
-            result = validator.validate(uuid_str)
-            self.assertFalse(result.is_valid)
+        self.assertIsInstance(UUID, UUIDValidator)
+
+    def test_factory_validators_are_shared(self):
+        """Test that built-in factories share one instance and copy on configuration"""
+        self.assertIs(Schema.email(), Schema.email())
+        self.assertIs(Schema.ip_address(allow_ipv6=False), Schema.ip_address(True, False))
+        
+        # Configuring a shared validator returns a copy and leaves the shared one untouched
+        optional_email = Schema.email().optional()
+        self.assertIsNot(optional_email, Schema.email())
+        self.assertTrue(optional_email.validate(None).is_valid)
+        self.assertFalse(Schema.email().validate(None).is_valid)
+
+
+@pytest.mark.parametrize("email", ["test@example.com", "user.name@domain.co.uk", "a@b.c"])
+def test_valid_email(email):
+    """Test email validator factory with valid emails"""
+    assert EMAIL.validate(email).is_valid
+
+
+@pytest.mark.parametrize("email", ["invalid-email", "@domain.com", "user@", "user.domain.com"])
+def test_invalid_email(email):
+    """Test email validator factory with invalid emails"""
+    assert not EMAIL.validate(email).is_valid
+
+
+def test_email_pattern_message():
+    """Test email validator keeps reporting its anchored pattern"""
+    result = EMAIL.validate("invalid-email")
+    assert result.errors[0].message == r"String must match pattern: ^[^\s@]+@[^\s@]+\.[^\s@]+$"
+
+
+@pytest.mark.parametrize("url", ["http://example.com", "https://www.example.com/path", "http://localhost:3000"])
+def test_valid_url(url):
+    """Test URL validator factory with valid URLs"""
+    assert URL.validate(url).is_valid
+
+
+@pytest.mark.parametrize("url", ["not-a-url", "ftp://example.com", "example.com"])
+def test_invalid_url(url):
+    """Test URL validator factory with invalid URLs"""
+    assert not URL.validate(url).is_valid
+
+
+@pytest.mark.parametrize("uuid_str", [
+    "123e4567-e89b-12d3-a456-426614174000",
+    "550e8400-e29b-41d4-a716-446655440000"
+])
+def test_valid_uuid(uuid_str):
+    """Test UUID validator factory with valid UUIDs"""
+    assert UUID.validate(uuid_str).is_valid
+
+
+# Includes uppercase hex and misplaced hyphens
+@pytest.mark.parametrize("uuid_str", [
+    "not-a-uuid",
+    "123e4567-e89b-12d3-a456",
+    "invalid-uuid-format",
+    "123E4567-E89B-12D3-A456-426614174000",
+    "123e4567-e89b-12d3-a456-4266-4174000",
+    "123e4567e-89b-12d3-a456-426614174000"
+])
+def test_invalid_uuid(uuid_str):
+    """Test UUID validator factory with invalid UUIDs"""
+    result = UUID.validate(uuid_str)
+    assert not result.is_valid
+    assert result.errors[0].code == "INVALID_UUID"
+
+
+# Complex schemas are defined and compiled once per module; each payload is one test case
+USER_REGISTRATION_SCHEMA = Schema.object({
+    'username': Schema.string().min_length(3).max_length(20).pattern(_RE_USERNAME),
+    'email': EMAIL,
+    'password': Schema.string().min_length(8),
+    'age': Schema.number().min_value(13).max_value(120).integer_only().optional(),
+    'preferences': Schema.object({
+        'theme': Schema.string().allowed_values(['light', 'dark']).optional(),
+        'notifications': Schema.boolean().optional()
+    }).optional(),
+    'tags': Schema.array(_STR).max_length(5).unique().optional()
+}).compile()
+
+_PRODUCT_SCHEMA = Schema.object({
+    'id': _STR,
+    'name': Schema.string().min_length(1),
+    'price': Schema.number().min_value(0),
+    'quantity': Schema.number().integer_only().min_value(1)
+})
+
+ORDER_SCHEMA = Schema.object({
+    'orderId': _STR,
+    'customer': Schema.object({
+        'name': Schema.string().min_length(2),
+        'email': EMAIL,
+        'phone': Schema.string().pattern(_RE_PHONE).optional()
+    }),
+    'products': Schema.array(_PRODUCT_SCHEMA).min_length(1),
+    'total': Schema.number().min_value(0),
+    'status': Schema.string().allowed_values(['pending', 'confirmed', 'shipped', 'delivered']),
+    'createdAt': Schema.date().format('%Y-%m-%d %H:%M:%S')
+}).compile()
+
+
+@pytest.mark.parametrize("data, min_errors", [
+    # Valid data
+    ({
+        'username': 'john_doe',
+        'email': 'john@example.com',
+        'password': 'securepass123',
+        'age': 25,
+        'preferences': {
+            'theme': 'dark',
+            'notifications': True
+        },
+        'tags': ['developer', 'python']
+    }, 0),
+    # Invalid data (multiple errors)
+    ({
+        'username': 'jo',  # Too short
+        'email': 'invalid-email',  # Invalid email
+        'password': '123',  # Too short
+        'age': 5,  # Too young
+        'preferences': {
+            'theme': 'invalid-theme'  # Not allowed
+        },
+        'tags': ['dev', 'dev']  # Duplicate
+    }, 2),
+], ids=["valid", "invalid"])
+def test_user_registration_schema(data, min_errors):
+    """Test complex user registration schema"""
+    result = USER_REGISTRATION_SCHEMA.validate(data)
+    assert result.is_valid is (min_errors == 0)
+    assert len(result.errors) >= min_errors
+
+
+_VALID_ORDER = {
+    'orderId': 'ORD-12345',
+    'customer': {
+        'name': 'John Doe',
+        'email': 'john@example.com',
+        'phone': '+1-555-123-4567'
+    },
+    'products': [
+        {'id': 'PROD-1', 'name': 'Laptop', 'price': 999.99, 'quantity': 1},
+        {'id': 'PROD-2', 'name': 'Mouse', 'price': 29.99, 'quantity': 2}
+    ],
+    'total': 1059.97,
+    'status': 'pending',
+    'createdAt': '2024-01-15 10:30:00'
+}
+
+
+@pytest.mark.parametrize("data, error_fields", [
+    (_VALID_ORDER, []),
+    ({**_VALID_ORDER, 'products': []}, ['products']),  # At least one product
+    ({**_VALID_ORDER, 'status': 'lost'}, ['status']),  # Not an allowed status
+    ({**_VALID_ORDER, 'products': [{'id': 'PROD-1', 'name': 'Laptop', 'price': 999.99, 'quantity': 0}]},
+     ['products[0].quantity']),  # Quantity must be at least 1
+], ids=["valid", "no-products", "bad-status", "bad-quantity"])
+def test_ecommerce_order_schema(data, error_fields):
+    """Test e-commerce order schema"""
+    result = ORDER_SCHEMA.validate(data)
+    assert result.is_valid is (not error_fields)
+    assert [e.field for e in result.errors] == error_fields
 
 
 class TestComplexSchemas(unittest.TestCase):
     """Test cases for complex schema combinations"""
 
-    def test_user_registration_schema(self):
-        """Test complex user registration schema"""
+    def test_compile(self):
+        """Test compiling a schema ahead of validation"""
         schema = Schema.object({
-            'username': Schema.string().min_length(3).max_length(20).pattern(r'^[a-zA-Z0-9_]+$'),
-            'email': Schema.email(),
-            'password': Schema.string().min_length(8),
-            'age': Schema.number().min_value(13).max_value(120).integer_only().optional(),
-            'preferences': Schema.object({
-                'theme': Schema.string().allowed_values(['light', 'dark']).optional(),
-                'notifications': Schema.boolean().optional()
-            }).optional(),
-            'tags': Schema.array(Schema.string()).max_length(5).unique().optional()
-        })
-        
-        # Valid data
-        valid_data = {
-            'username': 'john_doe',
-            'email': 'john@example.com',
-            'password': 'securepass123',
-            'age': 25,
-            'preferences': {
-                'theme': 'dark',
-                'notifications': True
-            },
-            'tags': ['developer', 'python']
-        }
-        result = schema.validate(valid_data)
-        self.assertTrue(result.is_valid)
-        
-        # Invalid data (multiple errors)
-        invalid_data = {
-            'username': 'jo',  # Too short
-            'email': 'invalid-email',  # Invalid email
-            'password': '123',  # Too short
-            'age': 5,  # Too young
-            'preferences': {
-                'theme': 'invalid-theme'  # Not allowed
-            },
-            'tags': ['dev', 'dev']  # Duplicate
-        }
-        result = schema.validate(invalid_data)
-        self.assertFalse(result.is_valid)
-        self.assertGreater(len(result.errors), 1)
-
-    def test_ecommerce_order_schema(self):
-        """Test e-commerce order schema"""
-        product_schema = Schema.object({
-            'id': Schema.string(),
-            'name': Schema.string().min_length(1),
-            'price': Schema.number().min_value(0),
-            'quantity': Schema.number().integer_only().min_value(1)
+            'name': Schema.string().min_length(2),
+            'tags': Schema.array(Schema.string().max_length(3))
         })
+        compiled = schema.compile()
+        self.assertIs(compiled, schema)
         
-        order_schema = Schema.object({
-            'orderId': Schema.string(),
-            'customer': Schema.object({
-                'name': Schema.string().min_length(2),
-                'email': Schema.email(),
-                'phone': Schema.string().pattern(r'^\+?[\d\s\-\(\)]+$').optional()
-            }),
-            'products': Schema.array(product_schema).min_length(1),
-            'total': Schema.number().min_value(0),
-            'status': Schema.string().allowed_values(['pending', 'confirmed', 'shipped', 'delivered']),
-            'createdAt': Schema.date().format('%Y-%m-%d %H:%M:%S')
-        })
-        
-        # Valid order
-        valid_order = {
-            'orderId': 'ORD-12345',
-            'customer': {
-                'name': 'John Doe',
-                'email': 'john@example.com',
-                'phone': '+1-555-123-4567'
-            },
-            'products': [
-                {'id': 'PROD-1', 'name': 'Laptop', 'price': 999.99, 'quantity': 1},
-                {'id': 'PROD-2', 'name': 'Mouse', 'price': 29.99, 'quantity': 2}
-            ],
-            'total': 1059.97,
-            'status': 'pending',
-            'createdAt': '2024-01-15 10:30:00'
-        }
-        result = order_schema.validate(valid_order)
-        self.assertTrue(result.is_valid)
+        self.assertTrue(compiled.validate({'name': 'Ann', 'tags': ['a']}).is_valid)
+        result = compiled.validate({'name': 'A', 'tags': ['abcd']})
+        self.assertEqual([e.code for e in result.errors], ["MIN_LENGTH", "MAX_LENGTH"])
 
     def test_data_transformation(self):
         """Test data transformation functionality"""
@@ -725,6 +1033,18 @@ class TestComplexSchemas(unittest.TestCase):
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and boundary conditions"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.optional_deep_validator = Schema.object({
+            'level1': Schema.object({
+                'level2': Schema.object({
+                    'level3': Schema.string().optional()
+                }).optional()
+            }).optional()
+        })
+        cls.long_string = "a" * 1000
+        cls.long_validator = Schema.string().max_length(100)
+
     def test_empty_values(self):
         """Test validation with empty values"""
         # Empty string (valid only if optional)
@@ -732,7 +1052,7 @@ class TestEdgeCases(unittest.TestCase):
         self.assertTrue(result.is_valid)
         
         # Empty array (valid by default)
-        result = Schema.array(Schema.string()).validate([])
+        result = Schema.array(_STR).validate([])
         self.assertTrue(result.is_valid)
         
         # Empty object (valid by default)
@@ -740,7 +1060,7 @@ class TestEdgeCases(unittest.TestCase):
         self.assertTrue(result.is_valid)
         
         # Empty array with min_length constraint
-        result = Schema.array(Schema.string()).min_length(1).validate([])
+        result = Schema.array(_STR).min_length(1).validate([])
         self.assertFalse(result.is_valid)
         self.assertEqual(result.errors[0].code, "MIN_LENGTH")
 
@@ -758,9 +1078,7 @@ class TestEdgeCases(unittest.TestCase):
     def test_extreme_values(self):
         """Test validation with extreme values"""
         # Very long string
-        long_string = "a" * 1000
-        result = Schema.string().max_length(100).validate(long_string)
-        self.assertFalse(result.is_valid)
+        self.assertFalse(self.long_validator.validate(self.long_string).is_valid)
         
         # Very large number
         large_number = 999999999999999
@@ -769,31 +1087,23 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_nested_optional_fields(self):
         """Test deeply nested optional fields"""
-        schema = Schema.object({
-            'level1': Schema.object({
-                'level2': Schema.object({
-                    'level3': Schema.string().optional()
-                }).optional()
-            }).optional()
-        })
-        
         # All levels present
         data = {'level1': {'level2': {'level3': 'value'}}}
-        result = schema.validate(data)
+        result = self.optional_deep_validator.validate(data)
         self.assertTrue(result.is_valid)
         
         # Missing optional levels
         data = {}
-        result = schema.validate(data)
+        result = self.optional_deep_validator.validate(data)
         self.assertTrue(result.is_valid)
 
     def test_circular_references(self):
         """Test handling of potential circular references"""
         # This should not cause infinite recursion
         schema = Schema.object({
-            'name': Schema.string(),
+            'name': _STR,
             'children': Schema.array(Schema.object({
-                'name': Schema.string(),
+                'name': _STR,
                 'parent': Schema.string().optional()
             })).optional()
         })
@@ -808,13 +1118,29 @@ class TestEdgeCases(unittest.TestCase):
         result = schema.validate(data)
         self.assertTrue(result.is_valid)
 
+    def test_pickle_after_validate(self):
+        """Test validators still pickle once their checks have been generated"""
+        schema = Schema.object({'name': Schema.string().min_length(2), 'site': URL})
+        data = {'name': 'A', 'site': 'ftp://x'}
+        expected = schema.validate(data)
+
+        restored = pickle.loads(pickle.dumps(schema))
+        self.assertEqual(restored.validate(data), expected)
+        self.assertTrue(restored.validate({'name': 'Al', 'site': 'http://x'}).is_valid)
+
 
 class TestFieldLevelValidators:
     """Test the field-level specialized validators"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.v4 = Schema.ip_address(allow_ipv4=True, allow_ipv6=False)
+        cls.v6 = Schema.ip_address(allow_ipv4=False, allow_ipv6=True)
+        cls.v4_v6 = Schema.ip_address(allow_ipv4=True, allow_ipv6=True)
     
     def test_ip_address_validator_ipv4(self):
         """Test IPv4 address validation"""
-        validator = Schema.ip_address(allow_ipv4=True, allow_ipv6=False)
+        validator = self.v4
         
         # Valid IPv4 addresses
         assert validator.validate("192.168.1.1").is_valid
@@ -830,10 +1156,12 @@ class TestFieldLevelValidators:
         assert not validator.validate("192.168.1.1.1").is_valid
         assert validator.validate("192.168.001.1").is_valid  # Leading zeros are allowed
         assert not validator.validate("192.168.1.").is_valid  # Trailing dot
+        assert not validator.validate(" 192.168.1.1").is_valid  # Surrounding whitespace
+        assert not validator.validate("192.168.1.1\n").is_valid
     
     def test_ip_address_validator_ipv6(self):
         """Test IPv6 address validation"""
-        validator = Schema.ip_address(allow_ipv4=False, allow_ipv6=True)
+        validator = self.v6
         
         # Valid IPv6 addresses
         assert validator.validate("2001:0db8:85a3:0000:0000:8a2e:0370:7334").is_valid
@@ -847,10 +1175,12 @@ class TestFieldLevelValidators:
         assert not validator.validate("2001:0db8:85a3:0000:0000:8a2e:0370:7334:extra").is_valid
         assert not validator.validate("2001:db8::1::2").is_valid  # Multiple ::
         assert not validator.validate("2001:db8:1").is_valid  # Too short
+        assert not validator.validate("::1\n").is_valid  # Surrounding whitespace
+        assert not validator.validate(" fe80::1%eth0").is_valid
     
     def test_ip_address_validator_both(self):
         """Test IP address validator allowing both IPv4 and IPv6"""
-        validator = Schema.ip_address(allow_ipv4=True, allow_ipv6=True)
+        validator = self.v4_v6
         
         # Valid IPv4
         assert validator.validate("192.168.1.1").is_valid
@@ -862,7 +1192,7 @@ class TestFieldLevelValidators:
     
     def test_ip_address_validator_ipv4_only(self):
         """Test IP address validator with IPv4 only"""
-        validator = Schema.ip_address(allow_ipv4=True, allow_ipv6=False)
+        validator = self.v4
         
         # IPv4 should work
         assert validator.validate("192.168.1.1").is_valid
@@ -888,6 +1218,8 @@ class TestFieldLevelValidators:
         assert not validator.validate("abc").is_valid  # Not numeric
         assert not validator.validate("0123456789").is_valid  # Starts with 0
         assert not validator.validate("123-456").is_valid  # Too short after cleaning
+        assert not validator.validate("123+4567890").is_valid  # '+' only as the first character
+        assert not validator.validate("1234567\u00b2").is_valid  # Superscript two is a digit, not a decimal
     
     def test_phone_number_validator_with_country_code(self):
         """Test phone number validator with specific country code"""
@@ -940,9 +1272,18 @@ class TestFieldLevelValidators:
                 return False, "Password must be a string"
             if len(value) < 8:
                 return False, "Password must be at least 8 characters"
-            if not any(c.isupper() for c in value):
+            # One pass for both character classes, stopping once both are found
+            has_upper = has_digit = False
+            for c in value:
+                if c.isupper():
+                    has_upper = True
+                elif c.isdigit():
+                    has_digit = True
+                if has_upper and has_digit:
+                    break
+            if not has_upper:
                 return False, "Password must contain uppercase letter"
-            if not any(c.isdigit() for c in value):
+            if not has_digit:
                 return False, "Password must contain a digit"
             return True, ""
         
@@ -966,7 +1307,53 @@ class TestFieldLevelValidators:
         assert len(result.errors) == 1
         assert "Validation function error" in result.errors[0].message
         assert result.errors[0].code == "VALIDATION_ERROR"
-    
+        
+        # Each failure reports its own field path and value
+        other = validator.validate("other", "code")
+        assert (other.errors[0].field, other.errors[0].value) == ("code", "other")
+        assert other.errors[0].message == "Validation function error: Test exception"
+        assert result.errors[0].field == ""
+
+    def test_custom_validator_mixed_return_types(self):
+        """Test custom validator whose return shape changes between calls"""
+        def validate_mixed(value):
+            if value == 1:
+                return True
+            if value == 2:
+                return "Two is not allowed"
+            if value == 3:
+                return False, "Three is not allowed"
+            return None
+
+        validator = Schema.custom(validate_mixed)
+
+        for _ in range(2):
+            assert validator.validate(1).is_valid
+            assert validator.validate(2).errors[0].message == "Two is not allowed"
+            assert validator.validate(3).errors[0].message == "Three is not allowed"
+            assert validator.validate(4).errors[0].code == "VALIDATION_ERROR"
+
+    def test_custom_validator_declared_modes(self):
+        """Test custom validators with a declared return shape"""
+        even = Schema.custom_bool(lambda x: isinstance(x, int) and x % 2 == 0)
+        assert even.validate(4).is_valid
+        assert even.validate(3).errors[0].code == "CUSTOM_VALIDATION"
+
+        adult = Schema.custom_msg(lambda x: "" if x >= 18 else "Must be an adult")
+        assert adult.validate(30).is_valid
+        assert adult.validate(12).errors[0].message == "Must be an adult"
+
+        short = Schema.custom_pair(lambda x: (len(x) <= 3, "Too long"))
+        assert short.validate("abc").is_valid
+        assert short.validate("abcd").errors[0].message == "Too long"
+
+        # A function that breaks its declared shape is reported, not raised
+        broken = Schema.custom_pair(lambda x: True)
+        assert broken.validate("abc").errors[0].code == "VALIDATION_ERROR"
+
+        with pytest.raises(ValueError):
+            CustomValidator(lambda x: True, mode="int")
+
     def test_custom_validator_with_custom_message(self):
         """Test custom validator with custom error message"""
         def always_fail(value):
@@ -1007,8 +1394,8 @@ class TestFieldLevelValidators:
                 'ip_address': Schema.ip_address(),
                 'port': Schema.number().min_value(1).max_value(65535),
                 'contact_phone': Schema.phone_number().optional(),
-                'is_active': Schema.boolean(),
-                'tags': Schema.array(Schema.string()).min_length(1),
+                'is_active': _BOOL,
+                'tags': Schema.array(_STR).min_length(1),
                 'custom_field': Schema.custom(lambda x: isinstance(x, str) and len(x) > 3)
             })
         })
@@ -1048,5 +1435,5 @@ class TestFieldLevelValidators:
 
 
 if __name__ == '__main__':
-    # Run the tests
-    unittest.main(verbosity=2) 
\ No newline at end of file
+    # Run the tests - through pytest, so the parametrized tests are collected too
+    raise SystemExit(pytest.main([__file__, '-v'])) 
\ No newline at end of file
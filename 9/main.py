@@ -6,102 +6,218 @@ using OpenAI API.
 """
 
 import argparse
+import asyncio
+import hashlib
 import os
 import sys
+import tempfile
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, TextIO
 
-try:
-    from openai import OpenAI
-except ImportError:
-    print("Error: OpenAI library not installed. Please run: pip install -r requirements.txt")
-    sys.exit(1)
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+
+# Analyses are cached on disk per (model, prompt version, topic); bump PROMPT_VERSION
+# whenever the prompt changes so stale analyses are not reused
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "service_analyzer")
+PROMPT_VERSION = 2
+
+# Prompt sent for every analysis. It is split around the topic once here, so building a
+# prompt is a single concatenation instead of re-formatting the whole template per call.
+ANALYSIS_PROMPT_TEMPLATE = """Analyze "{topic}" from BUSINESS, TECHNICAL, and USER-FOCUSED perspectives. Your response must include ONLY these sections in EXACT order:
+
+## 1. Brief History
+- Founding year, milestones, etc.
+
+## 2. Target Audience
+- Primary user segments
+
+## 3. Core Features
+- Top 2–4 key functionalities
+
+## 4. Unique Selling Points
+- Key differentiators
+
+## 5. Business Model
+- How the service makes money
+
+## 6. Tech Stack Insights
+- Any hints about technologies used
+
+## 7. Perceived Strengths
+- Mentioned positives or standout features
+
+## 8. Perceived Weaknesses
+- Cited drawbacks or limitations
+
+Include ONLY these 8 sections. Do not add any other sections or analysis.
+Ensure each section incorporates insights from business, technical, and user-focused viewpoints where relevant.
+"""
+_PROMPT_PREFIX, _PROMPT_SUFFIX = ANALYSIS_PROMPT_TEMPLATE.split("{topic}")
+
+# Upper bound on simultaneous API requests when several topics are analyzed at once
+MAX_CONCURRENT_REQUESTS = 5
+
+# Placed between reports that share a file or the terminal
+REPORT_SEPARATOR = "\n\n" + "="*80 + "\n\n"
+REPORT_FOOTER = "\n\n---\n\n*Report generated using OpenAI API - Service Analyzer*\n"
 
 
 class ReportGenerator:
     """Main class for generating comprehensive service analysis reports from business, technical, and user perspectives using OpenAI API."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
         """Initialize the report generator with OpenAI API key."""
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY environment variable or pass it as parameter.")
         
+        # Imported here rather than at module level, so --help and argument errors don't pay for loading it
+        try:
+            from openai import OpenAI
+        except ImportError:
+            raise ImportError("OpenAI library not installed. Please run: pip install -r requirements.txt") from None
+        
         self.client = OpenAI(api_key=self.api_key)
         self.model = "gpt-4.1-mini"
+        self.use_cache = use_cache
+        self._cache: Dict[str, str] = {}  # In-process copy of the analyses read or written this run
     
-    def generate_comprehensive_analysis(self, topic: str) -> str:
-        """Generate comprehensive analysis from business, technical, and user-focused perspectives."""
-        prompt = f"""
-        Analyze "{topic}" from BUSINESS, TECHNICAL, and USER-FOCUSED perspectives. Your response must include ONLY these sections in EXACT order:
-
-        ## 1. Brief History
-        - Founding year, milestones, etc.
-
-        ## 2. Target Audience
-        - Primary user segments
-
-        ## 3. Core Features
-        - Top 2–4 key functionalities
-
-        ## 4. Unique Selling Points
-        - Key differentiators
-
-        ## 5. Business Model
-        - How the service makes money
-
-        ## 6. Tech Stack Insights
-        - Any hints about technologies used
-
-        ## 7. Perceived Strengths
-        - Mentioned positives or standout features
-
-        ## 8. Perceived Weaknesses
-        - Cited drawbacks or limitations
-
-        Include ONLY these 8 sections. Do not add any other sections or analysis.
-        Ensure each section incorporates insights from business, technical, and user-focused viewpoints where relevant.
+    def _cache_key(self, topic: str) -> str:
+        """Build the cache key for an analysis of the topic with the current model and prompt."""
+        return hashlib.sha256(f"{self.model}\n{PROMPT_VERSION}\n{topic}".encode("utf-8")).hexdigest()
+    
+    def _read_cached_analysis(self, key: str) -> Optional[str]:
+        """Return a previously generated analysis, or None if it is not cached."""
+        if key in self._cache:
+            return self._cache[key]
+        try:
+            with open(os.path.join(CACHE_DIR, f"{key}.md"), 'r', encoding='utf-8') as f:
+                analysis = f.read()
+        except OSError:
+            return None
+        self._cache[key] = analysis
+        return analysis
+    
+    def _write_cached_analysis(self, key: str, analysis: str) -> None:
+        """Store an analysis in memory and on disk - a cache that cannot be written is skipped."""
+        self._cache[key] = analysis
+        tmp_path = None
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write a temporary file and move it into place, so an interrupted or concurrent run
+            # never leaves a truncated analysis where later runs would read it
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(analysis)
+            os.replace(tmp_path, os.path.join(CACHE_DIR, f"{key}.md"))
+        except OSError:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def generate_comprehensive_analysis(self, topic: str, out: Optional[TextIO] = None) -> str:
+        """Generate comprehensive analysis from business, technical, and user-focused perspectives.
+        
+        The response is streamed: if out is given, each piece of text is written to it as soon
+        as it arrives. The full analysis is returned either way.
         """
+        if self.use_cache:
+            cache_key = self._cache_key(topic)
+            cached = self._read_cached_analysis(cache_key)
+            if cached is not None:
+                if out is not None:
+                    out.write(cached)
+                return cached
         
+        prompt = _PROMPT_PREFIX + topic + _PROMPT_SUFFIX
+        parts = []
         try:
-            response = self.client.chat.completions.create(
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=1500,  # Increased for more comprehensive analysis
-                temperature=0.7
+                temperature=0.7,
+                stream=True
             )
-            return response.choices[0].message.content
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    if out is not None:
+                        out.write(delta)
+                        out.flush()
+        except Exception as e:
+            # Keep whatever already arrived - it has been written to out
+            error = f"Error generating comprehensive analysis: {str(e)}"
+            if out is not None:
+                out.write(error)
+            return "".join(parts) + error
+        
+        analysis = "".join(parts)
+        # Only successful analyses are cached, so a failed request is retried next time
+        if self.use_cache and analysis:
+            self._write_cached_analysis(cache_key, analysis)
+        return analysis
+    
+    async def _generate_analysis_async(self, client: "AsyncOpenAI", semaphore: asyncio.Semaphore, topic: str) -> str:
+        """Generate one analysis with the async client, waiting for a free request slot."""
+        if self.use_cache:
+            cache_key = self._cache_key(topic)
+            cached = self._read_cached_analysis(cache_key)
+            if cached is not None:
+                return cached
+        
+        try:
+            async with semaphore:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": _PROMPT_PREFIX + topic + _PROMPT_SUFFIX}],
+                    max_tokens=1500,
+                    temperature=0.7
+                )
+            # content is None when the model returns no text (e.g. a content-filter finish)
+            analysis = response.choices[0].message.content or ""
         except Exception as e:
             return f"Error generating comprehensive analysis: {str(e)}"
-
-
+        
+        if self.use_cache and analysis:
+            self._write_cached_analysis(cache_key, analysis)
+        return analysis
     
-    def generate_comprehensive_report(self, topic: str) -> str:
-        """Generate a comprehensive report combining business, technical, and user perspectives."""
-        print(f"Generating comprehensive report for: {topic}")
-        print("This may take a moment...")
+    async def generate_comprehensive_reports_async(self, topics: List[str]) -> List[str]:
+        """Generate reports for several topics concurrently, returned in the order of topics.
         
-        # Generate comprehensive analysis
-        print("⏳ Analyzing from business, technical, and user perspectives...")
-        analysis = self.generate_comprehensive_analysis(topic)
+        At most MAX_CONCURRENT_REQUESTS requests are in flight at once, to stay within rate limits.
+        """
+        from openai import AsyncOpenAI  # Available - __init__ already imported the package
         
-        # Combine into comprehensive report
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        async with AsyncOpenAI(api_key=self.api_key) as client:
+            analyses = await asyncio.gather(
+                *(self._generate_analysis_async(client, semaphore, topic) for topic in topics))
+        return [self._report_header(topic) + analysis + REPORT_FOOTER
+                for topic, analysis in zip(topics, analyses)]
+    
+    @staticmethod
+    def _report_header(topic: str) -> str:
+        """Build the title and timestamp lines that open a report."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return f"# Comprehensive Analysis Report: {topic}\n\n*Generated on: {timestamp}*\n\n---\n\n"
+    
+    def generate_comprehensive_report(self, topic: str, out: Optional[TextIO] = None) -> str:
+        """Generate a comprehensive report combining business, technical, and user perspectives.
         
-        report = f"""# Comprehensive Analysis Report: {topic}
-
-*Generated on: {timestamp}*
-
----
-
-{analysis}
-
----
-
-*Report generated using OpenAI API - Service Analyzer*
-"""
+        If out is given, the report is written to it while the analysis streams in.
+        """
+        header = self._report_header(topic)
+        if out is not None:
+            out.write(header)
+        analysis = self.generate_comprehensive_analysis(topic, out)
+        if out is not None:
+            out.write(REPORT_FOOTER)
         
-        return report
+        return header + analysis + REPORT_FOOTER
 
 
 def main():
@@ -125,12 +241,19 @@ Examples:
   
   # With API key parameter
   python main.py --api-key YOUR_API_KEY "OpenAI"
+  
+  # Ask the API again instead of reusing a cached analysis
+  python main.py --no-cache "Spotify"
+  
+  # Several topics at once (requested concurrently, reports kept in this order)
+  python main.py "Spotify" "Netflix" "Tesla"
         """
     )
     
     parser.add_argument(
         "topic",
-        help="The service name or topic to analyze (enclose in quotes if multiple words)"
+        nargs="+",
+        help="One or more service names or topics to analyze (enclose each in quotes if multiple words)"
     )
     
     parser.add_argument(
@@ -162,21 +285,49 @@ Examples:
         help="Display output in terminal instead of saving to file"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API instead of reusing analyses cached in ~/.cache/service_analyzer"
+    )
+    
     args = parser.parse_args()
     
+    # Fail fast on a missing key, before the OpenAI client is imported and built
+    if not (args.api_key or os.getenv('OPENAI_API_KEY')):
+        parser.error(
+            "OpenAI API key is required. Either:\n"
+            "  Method 1: Set environment variable - export OPENAI_API_KEY='your-key-here'\n"
+            "  Method 2: Use --api-key parameter - python main.py --api-key 'your-key-here' 'your topic'"
+        )
+    
     try:
         # Initialize report generator
-        generator = ReportGenerator(api_key=args.api_key)
+        generator = ReportGenerator(api_key=args.api_key, use_cache=not args.no_cache)
         generator.model = args.model
         
-        # Generate comprehensive report
-        report = generator.generate_comprehensive_report(args.topic)
+        if len(args.topic) == 1:
+            topic = args.topic[0]
+            print(f"Generating comprehensive report for: {topic}")
+            print("⏳ Analyzing from business, technical, and user perspectives...")
+            
+            def write_reports(out: TextIO) -> None:
+                # Stream the report to its destination as it arrives
+                generator.generate_comprehensive_report(topic, out=out)
+        else:
+            print(f"Generating comprehensive reports for: {', '.join(args.topic)}")
+            print("⏳ Analyzing from business, technical, and user perspectives...")
+            # Concurrent responses would interleave, so the reports are collected first
+            reports = asyncio.run(generator.generate_comprehensive_reports_async(args.topic))
+            
+            def write_reports(out: TextIO) -> None:
+                out.write(REPORT_SEPARATOR.join(reports))
         
-        # Output report
         if args.console:
             # Display in terminal
             print("\n" + "="*80)
-            print(report)
+            write_reports(sys.stdout)
+            print()
             print("="*80)
             print("📊 Report displayed in terminal")
         else:
@@ -187,34 +338,30 @@ Examples:
                 # Clear file if requested
                 if args.clear_samples:
                     with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(report)
+                        write_reports(f)
                     print(f"✅ Report saved to: {output_file} (file cleared)")
                 else:
-                    # Check if file exists and add separator
+                    # Add a separator if the file already has reports - its size is
+                    # enough, there is no need to read the whole collection back in
                     try:
-                        with open(output_file, 'r', encoding='utf-8') as f:
-                            existing_content = f.read().strip()
-                        if existing_content:
-                            separator = "\n\n" + "="*80 + "\n\n"
-                            report = separator + report
-                    except FileNotFoundError:
-                        pass  # File doesn't exist yet, no separator needed
+                        needs_separator = os.path.getsize(output_file) > 0
+                    except OSError:
+                        needs_separator = False  # File doesn't exist yet, no separator needed
                     
                     # Append to sample_outputs.md
                     with open(output_file, 'a', encoding='utf-8') as f:
-                        f.write(report)
+                        if needs_separator:
+                            f.write(REPORT_SEPARATOR)
+                        write_reports(f)
                     print(f"✅ Report appended to: {output_file}")
             else:
                 # For custom files, overwrite as usual
                 with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(report)
+                    write_reports(f)
                 print(f"✅ Report saved to: {output_file}")
             
-    except ValueError as e:
-        print(f"❌ Configuration Error: {e}")
-        print("\nPlease ensure you have set your OpenAI API key:")
-        print("  Method 1: Set environment variable - export OPENAI_API_KEY='your-key-here'")
-        print("  Method 2: Use --api-key parameter - python main.py --api-key 'your-key-here' 'your topic'")
+    except ImportError as e:
+        print(f"Error: {e}")
         sys.exit(1)
         
     except Exception as e: